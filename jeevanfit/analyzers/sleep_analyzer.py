@@ -2,7 +2,7 @@
 
 from datetime import time, datetime, timedelta
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from jeevanfit.models.core import LifestyleInput, SleepData, HabitType
@@ -45,6 +45,9 @@ class SleepCorrelation(BaseModel):
     impact: ImpactType = Field(description="Type of impact on sleep")
     strength: int = Field(ge=1, le=10, description="Strength of correlation")
     description: str = Field(description="Explanation of the correlation")
+    factor: Optional[SleepDisruptorType] = Field(
+        None, description="Lifestyle factor the correlation relates to"
+    )
 
 
 class SleepDisruptor(BaseModel):
@@ -69,6 +72,15 @@ class SleepAnalysis(BaseModel):
     correlations: List[SleepCorrelation] = Field(description="Habit-sleep correlations")
     recommendations: List[Recommendation] = Field(description="Actionable recommendations")
     explanation: str = Field(description="Comprehensive explanation")
+    
+    @property
+    def correlations_by_factor(self) -> Dict[SleepDisruptorType, List[SleepCorrelation]]:
+        """Correlations grouped by lifestyle factor, rebuilt from the current correlations on each access."""
+        grouped: Dict[SleepDisruptorType, List[SleepCorrelation]] = {}
+        for correlation in self.correlations:
+            if correlation.factor is not None:
+                grouped.setdefault(correlation.factor, []).append(correlation)
+        return grouped
 
 
 class SleepAnalyzer:
@@ -266,6 +278,7 @@ class SleepAnalyzer:
             strength = min(10, int(10 - hours_gap))  # Closer = stronger impact
             
             return SleepCorrelation(
+                factor=SleepDisruptorType.CAFFEINE,
                 habit=f"Caffeine consumption {hours_gap:.1f} hours before bed",
                 impact=ImpactType.NEGATIVE,
                 strength=strength,
@@ -278,6 +291,7 @@ class SleepAnalyzer:
         else:
             # Caffeine consumed early enough - neutral or positive
             return SleepCorrelation(
+                factor=SleepDisruptorType.CAFFEINE,
                 habit="Caffeine consumption timing",
                 impact=ImpactType.NEUTRAL,
                 strength=2,
@@ -306,6 +320,7 @@ class SleepAnalyzer:
             strength = min(10, int(8 - hours_before_bed * 2))
             
             return SleepCorrelation(
+                factor=SleepDisruptorType.LATE_EATING,
                 habit=f"Eating {hours_before_bed:.1f} hours before bed",
                 impact=ImpactType.NEGATIVE,
                 strength=max(1, strength),
@@ -328,6 +343,7 @@ class SleepAnalyzer:
             # Dehydration - negative impact
             strength = 6
             return SleepCorrelation(
+                factor=SleepDisruptorType.DEHYDRATION,
                 habit=f"Low water intake ({water_intake:.0f}ml)",
                 impact=ImpactType.NEGATIVE,
                 strength=strength,
@@ -340,6 +356,7 @@ class SleepAnalyzer:
             # Slightly low hydration
             strength = 3
             return SleepCorrelation(
+                factor=SleepDisruptorType.DEHYDRATION,
                 habit=f"Suboptimal water intake ({water_intake:.0f}ml)",
                 impact=ImpactType.NEUTRAL,
                 strength=strength,
@@ -366,6 +383,7 @@ class SleepAnalyzer:
             # High stress - strong negative impact
             strength = 9
             return SleepCorrelation(
+                factor=SleepDisruptorType.STRESS,
                 habit=f"High stress levels (intensity {max_stress}/10)",
                 impact=ImpactType.NEGATIVE,
                 strength=strength,
@@ -379,6 +397,7 @@ class SleepAnalyzer:
             # Moderate stress
             strength = 6
             return SleepCorrelation(
+                factor=SleepDisruptorType.STRESS,
                 habit=f"Moderate stress levels (intensity {max_stress}/10)",
                 impact=ImpactType.NEGATIVE,
                 strength=strength,
@@ -412,6 +431,7 @@ class SleepAnalyzer:
             strength = min(10, int(8 - hours_gap * 2))
             
             return SleepCorrelation(
+                factor=SleepDisruptorType.SCREEN_TIME,
                 habit=f"Screen time {hours_gap:.1f} hours before bed",
                 impact=ImpactType.NEGATIVE,
                 strength=max(1, strength),
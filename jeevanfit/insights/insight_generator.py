@@ -1,5 +1,7 @@
 """Insight generator for aggregating multi-analyzer outputs."""
 
+import unicodedata
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
 from typing import Any, List
@@ -29,6 +31,9 @@ class AnalysisResult(BaseModel):
     confidence: float = Field(ge=0, le=100, description="Confidence percentage")
     timestamp: datetime = Field(description="When the analysis was performed")
 
+    class Config:
+        frozen = True
+
 
 class Insight(BaseModel):
     """Cohesive insight generated from multiple analysis results."""
@@ -40,10 +45,27 @@ class Insight(BaseModel):
     actionable: bool = Field(description="Whether the insight suggests actions")
     related_insights: List[str] = Field(default_factory=list, description="IDs of related insights")
 
+    class Config:
+        frozen = True
+
 
 class InsightGenerator:
     """Generates cohesive insights from multiple analyzer outputs."""
     
+    # Maximum number of generated insights kept for reuse
+    CACHE_SIZE = 256
+    
+    # Sort rank of each priority level (lower ranks sort first)
+    PRIORITY_RANK = {
+        InsightPriority.HIGH: 0,
+        InsightPriority.MEDIUM: 1,
+        InsightPriority.LOW: 2
+    }
+    
+    def __init__(self):
+        """Initialize the InsightGenerator with an empty insight cache."""
+        self._cache: "OrderedDict[tuple, Insight]" = OrderedDict()
+    
     def generate_insight(self, analysis_results: List[AnalysisResult]) -> Insight:
         """
         Aggregate multi-analyzer outputs into a cohesive insight.
@@ -57,6 +79,18 @@ class InsightGenerator:
         if not analysis_results:
             raise ValueError("Cannot generate insight from empty analysis results")
         
+        # Apart from actionability, the insight depends only on the ordered
+        # sources and confidences, so identical inputs reuse a cached insight
+        actionable = self._is_actionable(analysis_results)
+        cache_key = (
+            tuple((r.source, r.confidence) for r in analysis_results),
+            actionable
+        )
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached.model_copy(update={"related_insights": []})
+        
         # Determine the primary source (highest confidence)
         primary_result = max(analysis_results, key=lambda r: r.confidence)
         
@@ -79,10 +113,7 @@ class InsightGenerator:
         # Determine category
         category = self._determine_category(primary_result.source)
         
-        # Check if actionable
-        actionable = self._is_actionable(analysis_results)
-        
-        return Insight(
+        insight = Insight(
             title=title,
             summary=summary,
             details=details,
@@ -91,6 +122,13 @@ class InsightGenerator:
             actionable=actionable,
             related_insights=[]
         )
+        
+        self._cache[cache_key] = insight
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        
+        # Hand out a copy so callers cannot mutate the cached insight
+        return insight.model_copy(update={"related_insights": []})
     
     def prioritize_insights(self, insights: List[Insight]) -> List[Insight]:
         """
@@ -105,23 +143,20 @@ class InsightGenerator:
         if not insights:
             return []
         
-        # Filter redundant insights
-        filtered_insights = self._filter_redundant(insights)
-        
-        # Sort by priority (HIGH > MEDIUM > LOW) and actionability
-        priority_order = {
-            InsightPriority.HIGH: 3,
-            InsightPriority.MEDIUM: 2,
-            InsightPriority.LOW: 1
-        }
-        
-        sorted_insights = sorted(
-            filtered_insights,
-            key=lambda i: (priority_order[i.priority], i.actionable),
-            reverse=True
-        )
+        # Sort by priority (HIGH > MEDIUM > LOW) and actionability. Each
+        # insight gets a precomputed integer key (priority rank, then
+        # actionable first); the index keeps the sort stable and ensures
+        # insights themselves are never compared.
+        decorated = [
+            ((self.PRIORITY_RANK[insight.priority] << 1) | (0 if insight.actionable else 1), idx, insight)
+            for idx, insight in enumerate(insights)
+        ]
+        decorated.sort()
+        sorted_insights = [insight for _, _, insight in decorated]
         
-        return sorted_insights
+        # Filter redundant insights after sorting so the highest-ranked
+        # insight of each redundant group is the one kept
+        return self._filter_redundant(sorted_insights)
     
     def _generate_title(self, primary_result: AnalysisResult) -> str:
         """Generate a title based on the primary analysis result."""
@@ -209,14 +244,18 @@ class InsightGenerator:
             return insights
         
         filtered = []
-        seen_categories = set()
+        seen_keys = set()
         
         for insight in insights:
             # Create a key based on category and title similarity
-            key = (insight.category, insight.title[:20])  # First 20 chars of title
+            key = (insight.category, self._normalize_title(insight.title)[:20])  # First 20 chars of title
             
-            if key not in seen_categories:
+            if key not in seen_keys:
                 filtered.append(insight)
-                seen_categories.add(key)
+                seen_keys.add(key)
         
         return filtered
+    
+    def _normalize_title(self, title: str) -> str:
+        """Normalize a title for redundancy comparison (Unicode form and case)."""
+        return unicodedata.normalize("NFKC", title).casefold()
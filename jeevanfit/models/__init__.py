@@ -9,6 +9,7 @@ from .core import (
     Habit,
     ValidationResult,
     ValidationError,
+    ValidationErrorCode,
     BodyTypeClassification,
     HabitType,
 )
@@ -22,6 +23,7 @@ __all__ = [
     "Habit",
     "ValidationResult",
     "ValidationError",
+    "ValidationErrorCode",
     "BodyTypeClassification",
     "HabitType",
 ]
@@ -2,7 +2,7 @@
 
 from datetime import datetime, time
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -24,6 +24,18 @@ class HabitType(str, Enum):
     OTHER = "other"
 
 
+class ValidationErrorCode(str, Enum):
+    """Machine-readable kinds of validation errors."""
+    MISSING_REQUIRED = "missing_required"
+    NO_MEANINGFUL_DATA = "no_meaningful_data"
+    NOT_NUMERIC = "not_numeric"
+    SLEEP_DURATION_RANGE = "sleep_duration_range"
+    INCONSISTENT_SLEEP = "inconsistent_sleep"
+    DUPLICATE_FOOD_ITEMS = "duplicate_food_items"
+    NUTRIENT_TOO_HIGH = "nutrient_too_high"
+    INVALID_VALUE = "invalid_value"
+
+
 class NutritionalInfo(BaseModel):
     """Nutritional information for a food item."""
     calories: float = Field(ge=0, description="Calories per serving")
@@ -175,6 +187,13 @@ class ValidationError(BaseModel):
     field: str = Field(description="Field that failed validation")
     message: str = Field(description="Error message")
     suggested_fix: str = Field(description="Suggestion for fixing the error")
+    code: ValidationErrorCode = Field(
+        ValidationErrorCode.INVALID_VALUE,
+        description="Kind of error, for checks that should not parse the message"
+    )
+
+    class Config:
+        frozen = True
 
 
 class ValidationResult(BaseModel):
@@ -182,3 +201,14 @@ class ValidationResult(BaseModel):
     is_valid: bool = Field(description="Whether the input is valid")
     errors: List[ValidationError] = Field(default_factory=list, description="List of validation errors")
     validated_data: Optional[LifestyleInput] = Field(None, description="Validated data if valid")
+
+    class Config:
+        frozen = True
+
+    @property
+    def errors_by_field(self) -> Dict[str, List[ValidationError]]:
+        """Errors grouped by field name, rebuilt from the current errors on each access."""
+        grouped: Dict[str, List[ValidationError]] = {}
+        for error in self.errors:
+            grouped.setdefault(error.field, []).append(error)
+        return grouped
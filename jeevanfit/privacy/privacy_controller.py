@@ -6,7 +6,7 @@ Uses AES-256 encryption for data at rest.
 
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List
 from datetime import datetime
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
@@ -95,8 +95,39 @@ class PrivacyController:
         """
         # Serialize data to JSON
         json_data = json.dumps(data, default=str)
-        plaintext = json_data.encode('utf-8')
+        return self._encrypt_plaintext(json_data.encode('utf-8'))
+    
+    def encryptDataBatch(self, items: List[Any]) -> List[EncryptedData]:
+        """Encrypt several pieces of data using AES-256 encryption.
+        
+        Each item gets its own random IV, as with encryptData. An object that
+        appears more than once in the batch is only JSON serialized once.
+        
+        Args:
+            items: Data to encrypt (each will be JSON serialized)
         
+        Returns:
+            EncryptedData objects in the same order as items
+        """
+        serialized: Dict[int, bytes] = {}
+        results = []
+        for data in items:
+            plaintext = serialized.get(id(data))
+            if plaintext is None:
+                plaintext = json.dumps(data, default=str).encode('utf-8')
+                serialized[id(data)] = plaintext
+            results.append(self._encrypt_plaintext(plaintext))
+        return results
+    
+    def _encrypt_plaintext(self, plaintext: bytes) -> EncryptedData:
+        """Encrypt serialized plaintext under a fresh random IV.
+        
+        Args:
+            plaintext: UTF-8 encoded JSON to encrypt
+        
+        Returns:
+            EncryptedData object containing ciphertext and IV
+        """
         # Generate random IV (Initialization Vector)
         iv = os.urandom(16)  # AES block size is 16 bytes
         
@@ -1,7 +1,8 @@
 """Input validation and sanitization for JeevanFit."""
 
+import operator
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pydantic import ValidationError as PydanticValidationError
 
@@ -9,6 +10,7 @@ from jeevanfit.models.core import (
     LifestyleInput,
     ValidationResult,
     ValidationError,
+    ValidationErrorCode,
     FoodItem,
     SleepData,
     Habit
@@ -27,16 +29,101 @@ class InputValidator:
         r'(\|\||&&|;|\$\()',  # Shell injection
     ]
     
+    # Compiled once when the class is created, with flags bound to the pattern
+    INJECTION_REGEX = re.compile('|'.join(INJECTION_PATTERNS), re.IGNORECASE)
+    
+    # Top-level fields that must be present, and fields that carry
+    # analyzable data (at least one of which must be provided)
+    REQUIRED_FIELDS = ('user_id', 'water_intake')
+    DATA_FIELDS = frozenset({'food_items', 'sleep_data', 'daily_habits'})
+    
+    # Numeric fields coerced during sanitization, with their target types
+    FOOD_ITEM_NUMERIC_FIELDS = {'serving_size': float}
+    NUTRITIONAL_NUMERIC_FIELDS = {
+        'calories': float,
+        'protein': float,
+        'carbohydrates': float,
+        'fat': float,
+        'sodium': float,
+        'sugar': float,
+        'fiber': float,
+        'processing_level': int,
+    }
+    HABIT_NUMERIC_FIELDS = {'intensity': int, 'duration': float}
+    
+    # Upper limits for nutritional values of a single food item:
+    # field -> (label, limit, unit)
+    NUTRITIONAL_LIMITS = {
+        'calories': ('Calorie', 5000, ''),
+        'protein': ('Protein', 200, 'g'),
+        'carbohydrates': ('Carbohydrate', 500, 'g'),
+        'fat': ('Fat', 200, 'g'),
+        'sodium': ('Sodium', 5000, 'mg'),
+    }
+    # Fetches all limited nutrient values of an item in one call
+    NUTRIENT_VALUES = operator.attrgetter(*NUTRITIONAL_LIMITS)
+    NUTRIENT_MAXIMA = tuple(limit for _, limit, _ in NUTRITIONAL_LIMITS.values())
+    
+    # (message, suggested_fix) templates for each kind of error, filled in
+    # with str.format_map
+    ERROR_TEMPLATES = {
+        ValidationErrorCode.MISSING_REQUIRED: (
+            "Required field '{field}' is missing",
+            "Please provide a value for '{field}'",
+        ),
+        ValidationErrorCode.NO_MEANINGFUL_DATA: (
+            "Input must contain at least one of: food items, sleep data, or daily habits",
+            "Please provide food items, sleep information, or daily habits to analyze",
+        ),
+        ValidationErrorCode.NOT_NUMERIC: (
+            "Value {value!r} for '{field}' is not a valid number",
+            "Please provide a numeric value for '{field}'",
+        ),
+        ValidationErrorCode.SLEEP_DURATION_RANGE: (
+            "Sleep duration cannot exceed 24 hours",
+            "Please provide a sleep duration between 0 and 24 hours",
+        ),
+        ValidationErrorCode.INCONSISTENT_SLEEP: (
+            "High sleep quality (8+) with many interruptions (>5) seems inconsistent",
+            "Please verify sleep quality rating or number of interruptions",
+        ),
+        ValidationErrorCode.DUPLICATE_FOOD_ITEMS: (
+            "Duplicate food items detected",
+            "If you consumed the same food multiple times, consider combining them "
+            "or adding notes to distinguish",
+        ),
+        ValidationErrorCode.NUTRIENT_TOO_HIGH: (
+            "{label} value {value}{unit} is unrealistically high for a single food item",
+            "Please verify the {nutrient} value is correct "
+            "(typical range: 0-{limit}{unit} per serving)",
+        ),
+    }
+    
+    # Templates without placeholders are shared as-is by every error built
+    STATIC_ERROR_CODES = frozenset(
+        code for code, (message, suggested_fix) in ERROR_TEMPLATES.items()
+        if '{' not in message and '{' not in suggested_fix
+    )
+    
     def __init__(self):
         """Initialize the InputValidator."""
-        self.injection_regex = re.compile('|'.join(self.INJECTION_PATTERNS), re.IGNORECASE)
+        self.injection_regex = self.INJECTION_REGEX
     
-    def validate_input(self, input_data: Dict[str, Any]) -> ValidationResult:
+    def validate_input(
+        self, 
+        input_data: Dict[str, Any], 
+        fail_fast: bool = False
+    ) -> ValidationResult:
         """
         Validate lifestyle input for completeness and consistency.
         
+        Nested food, sleep and habit data are only validated once the
+        top-level checks pass.
+        
         Args:
             input_data: Dictionary containing lifestyle input data
+            fail_fast: If True, return as soon as a required field is found
+                missing instead of collecting all top-level errors
             
         Returns:
             ValidationResult with validation status and any errors
@@ -45,27 +132,33 @@ class InputValidator:
         """
         errors: List[ValidationError] = []
         
+        # Visit each top-level field once, noting required fields and
+        # whether any meaningful data (non-empty lists or sleep data) is present
+        present_required = set()
+        has_data = False
+        for key, value in input_data.items():
+            if value is None:
+                continue
+            if key in self.REQUIRED_FIELDS:
+                present_required.add(key)
+            elif key in self.DATA_FIELDS and (key == 'sleep_data' or value):
+                has_data = True
+        
         # Check for required fields
-        required_fields = ['user_id', 'water_intake']
-        for field in required_fields:
-            if field not in input_data or input_data[field] is None:
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Required field '{field}' is missing",
-                    suggested_fix=f"Please provide a value for '{field}'"
-                ))
+        for field in self.REQUIRED_FIELDS:
+            if field not in present_required:
+                errors.append(self._error(ValidationErrorCode.MISSING_REQUIRED, field))
         
-        # Check for at least some meaningful data
-        has_food = input_data.get('food_items') and len(input_data.get('food_items', [])) > 0
-        has_sleep = input_data.get('sleep_data') is not None
-        has_habits = input_data.get('daily_habits') and len(input_data.get('daily_habits', [])) > 0
+        if errors and fail_fast:
+            return ValidationResult(
+                is_valid=False,
+                errors=errors,
+                validated_data=None
+            )
         
-        if not (has_food or has_sleep or has_habits):
-            errors.append(ValidationError(
-                field='general',
-                message="Input must contain at least one of: food items, sleep data, or daily habits",
-                suggested_fix="Please provide food items, sleep information, or daily habits to analyze"
-            ))
+        # Check for at least some meaningful data
+        if not has_data:
+            errors.append(self._error(ValidationErrorCode.NO_MEANINGFUL_DATA, 'general'))
         
         # If there are basic validation errors, return early
         if errors:
@@ -102,7 +195,12 @@ class InputValidator:
                 errors.append(ValidationError(
                     field=field_path,
                     message=error['msg'],
-                    suggested_fix=self._get_fix_suggestion(field_path, error)
+                    suggested_fix=self._get_fix_suggestion(field_path, error),
+                    code=(
+                        ValidationErrorCode.MISSING_REQUIRED
+                        if error['type'] == 'missing'
+                        else ValidationErrorCode.INVALID_VALUE
+                    )
                 ))
             
             return ValidationResult(
@@ -123,32 +221,38 @@ class InputValidator:
             
         Requirements: 6.1, 6.2
         """
-        sanitized = input_data.copy()
-        
-        # Sanitize string fields recursively
-        sanitized = self._sanitize_strings(sanitized)
-        
-        # Normalize numeric values
-        if 'water_intake' in sanitized and sanitized['water_intake'] is not None:
-            sanitized['water_intake'] = float(sanitized['water_intake'])
+        return self._sanitize_input(input_data)
+    
+    def sanitize_and_validate(
+        self, 
+        input_data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], ValidationResult]:
+        """
+        Sanitize input data and validate the result.
         
-        # Ensure timestamp is present
-        if 'timestamp' not in sanitized or sanitized['timestamp'] is None:
-            sanitized['timestamp'] = datetime.now().isoformat()
+        String cleaning and numeric coercion share a single walk of the input.
+        Values that cannot be coerced are reported as validation errors rather
+        than raised.
         
-        # Normalize food items
-        if 'food_items' in sanitized and sanitized['food_items']:
-            sanitized['food_items'] = [
-                self._sanitize_food_item(item) for item in sanitized['food_items']
-            ]
+        Args:
+            input_data: Raw input data dictionary
+            
+        Returns:
+            Tuple of the sanitized input data and its ValidationResult
+            
+        Requirements: 6.1, 6.2, 6.3
+        """
+        errors: List[ValidationError] = []
+        sanitized = self._sanitize_input(input_data, errors)
         
-        # Normalize habits
-        if 'daily_habits' in sanitized and sanitized['daily_habits']:
-            sanitized['daily_habits'] = [
-                self._sanitize_habit(habit) for habit in sanitized['daily_habits']
-            ]
+        if errors:
+            return sanitized, ValidationResult(
+                is_valid=False,
+                errors=errors,
+                validated_data=None
+            )
         
-        return sanitized
+        return sanitized, self.validate_input(sanitized)
     
     def _check_consistency(self, lifestyle_input: LifestyleInput) -> List[ValidationError]:
         """
@@ -169,77 +273,96 @@ class InputValidator:
             # Check if duration matches bedtime/wake time difference
             # (This is a simplified check - real implementation would handle day boundaries)
             if sleep.duration > 24:
-                errors.append(ValidationError(
-                    field='sleep_data.duration',
-                    message='Sleep duration cannot exceed 24 hours',
-                    suggested_fix='Please provide a sleep duration between 0 and 24 hours'
-                ))
+                errors.append(self._error(ValidationErrorCode.SLEEP_DURATION_RANGE, 'sleep_data.duration'))
             
             # Check quality vs interruptions consistency
             if sleep.quality >= 8 and sleep.interruptions > 5:
-                errors.append(ValidationError(
-                    field='sleep_data',
-                    message='High sleep quality (8+) with many interruptions (>5) seems inconsistent',
-                    suggested_fix='Please verify sleep quality rating or number of interruptions'
-                ))
+                errors.append(self._error(ValidationErrorCode.INCONSISTENT_SLEEP, 'sleep_data'))
         
         # Check for duplicate food items (potential data entry error)
         if lifestyle_input.food_items:
-            food_names = [item.name.lower().strip() for item in lifestyle_input.food_items]
-            if len(food_names) != len(set(food_names)):
-                errors.append(ValidationError(
-                    field='food_items',
-                    message='Duplicate food items detected',
-                    suggested_fix='If you consumed the same food multiple times, consider combining them or adding notes to distinguish'
-                ))
+            if self._has_duplicate_food_items(lifestyle_input.food_items):
+                errors.append(self._error(ValidationErrorCode.DUPLICATE_FOOD_ITEMS, 'food_items'))
             
-            # Check for extreme nutritional values
+            # Check for extreme nutritional values. Items entirely within
+            # limits are skipped after a single comparison pass.
             for idx, item in enumerate(lifestyle_input.food_items):
                 if item.nutritional_info:
-                    nutritional = item.nutritional_info
-                    
-                    # Check for unrealistic calorie values
-                    if nutritional.calories > 5000:
-                        errors.append(ValidationError(
-                            field=f'food_items[{idx}].nutritional_info.calories',
-                            message=f'Calorie value {nutritional.calories} is unrealistically high for a single food item',
-                            suggested_fix='Please verify the calorie value is correct (typical range: 0-5000 per serving)'
-                        ))
+                    values = self.NUTRIENT_VALUES(item.nutritional_info)
+                    if all(v <= m for v, m in zip(values, self.NUTRIENT_MAXIMA)):
+                        continue
                     
-                    # Check for unrealistic protein values
-                    if nutritional.protein > 200:
-                        errors.append(ValidationError(
-                            field=f'food_items[{idx}].nutritional_info.protein',
-                            message=f'Protein value {nutritional.protein}g is unrealistically high for a single food item',
-                            suggested_fix='Please verify the protein value is correct (typical range: 0-200g per serving)'
-                        ))
-                    
-                    # Check for unrealistic carbohydrate values
-                    if nutritional.carbohydrates > 500:
-                        errors.append(ValidationError(
-                            field=f'food_items[{idx}].nutritional_info.carbohydrates',
-                            message=f'Carbohydrate value {nutritional.carbohydrates}g is unrealistically high for a single food item',
-                            suggested_fix='Please verify the carbohydrate value is correct (typical range: 0-500g per serving)'
-                        ))
-                    
-                    # Check for unrealistic fat values
-                    if nutritional.fat > 200:
-                        errors.append(ValidationError(
-                            field=f'food_items[{idx}].nutritional_info.fat',
-                            message=f'Fat value {nutritional.fat}g is unrealistically high for a single food item',
-                            suggested_fix='Please verify the fat value is correct (typical range: 0-200g per serving)'
-                        ))
-                    
-                    # Check for unrealistic sodium values
-                    if nutritional.sodium > 5000:
-                        errors.append(ValidationError(
-                            field=f'food_items[{idx}].nutritional_info.sodium',
-                            message=f'Sodium value {nutritional.sodium}mg is unrealistically high for a single food item',
-                            suggested_fix='Please verify the sodium value is correct (typical range: 0-5000mg per serving)'
-                        ))
+                    for (nutrient, (label, limit, unit)), value in zip(
+                        self.NUTRITIONAL_LIMITS.items(), values
+                    ):
+                        if value > limit:
+                            errors.append(self._error(
+                                ValidationErrorCode.NUTRIENT_TOO_HIGH,
+                                f'food_items[{idx}].nutritional_info.{nutrient}',
+                                label=label,
+                                nutrient=label.lower(),
+                                value=value,
+                                limit=limit,
+                                unit=unit
+                            ))
         
         return errors
     
+    def _error(
+        self,
+        code: ValidationErrorCode,
+        field: str,
+        **context: Any
+    ) -> ValidationError:
+        """
+        Build a ValidationError from the message templates.
+        
+        Args:
+            code: Kind of error, also the key into ERROR_TEMPLATES
+            field: Field that failed validation
+            **context: Values substituted into the templates
+            
+        Returns:
+            ValidationError with formatted message and suggested fix
+        """
+        message, suggested_fix = self.ERROR_TEMPLATES[code]
+        if code in self.STATIC_ERROR_CODES:
+            return ValidationError(
+                field=field,
+                message=message,
+                suggested_fix=suggested_fix,
+                code=code
+            )
+        context['field'] = field
+        return ValidationError(
+            field=field,
+            message=message.format_map(context),
+            suggested_fix=suggested_fix.format_map(context),
+            code=code
+        )
+    
+    def _has_duplicate_food_items(self, food_items: List[FoodItem]) -> bool:
+        """
+        Check whether two food items share a normalized name.
+        
+        Returns as soon as the first repeated name is seen.
+        
+        Args:
+            food_items: Parsed food items to check
+            
+        Returns:
+            True if a duplicate item is found
+        """
+        seen_names = set()
+        
+        for item in food_items:
+            name = item.name.lower().strip()
+            if name in seen_names:
+                return True
+            seen_names.add(name)
+        
+        return False
+    
     def _sanitize_strings(self, data: Any) -> Any:
         """
         Recursively sanitize string values in data structure.
@@ -272,9 +395,9 @@ class InputValidator:
         # Strip leading/trailing whitespace
         sanitized = value.strip()
         
-        # Remove potential injection patterns
-        if self.injection_regex.search(sanitized):
-            # Remove matched patterns
+        # Remove potential injection patterns, repeating until none remain
+        # so that a removal cannot splice together a new match
+        while self.injection_regex.search(sanitized):
             sanitized = self.injection_regex.sub('', sanitized)
         
         # Normalize whitespace
@@ -282,66 +405,182 @@ class InputValidator:
         
         return sanitized
     
-    def _sanitize_food_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    def _sanitize_input(
+        self, 
+        input_data: Dict[str, Any], 
+        errors: Optional[List[ValidationError]] = None
+    ) -> Dict[str, Any]:
+        """
+        Sanitize strings and coerce numeric values in a single pass.
+        
+        Args:
+            input_data: Raw input data dictionary
+            errors: If given, coercion failures are appended here instead of raised
+            
+        Returns:
+            Sanitized input data dictionary
+        """
+        sanitized: Dict[str, Any] = {}
+        
+        for key, value in input_data.items():
+            if key == 'water_intake':
+                sanitized[key] = self._coerce(value, float, key, errors)
+            elif key == 'food_items' and value:
+                sanitized[key] = [
+                    self._sanitize_food_item(item, f'{key}.{idx}', errors)
+                    for idx, item in enumerate(value)
+                ]
+            elif key == 'daily_habits' and value:
+                sanitized[key] = [
+                    self._sanitize_habit(habit, f'{key}.{idx}', errors)
+                    for idx, habit in enumerate(value)
+                ]
+            else:
+                sanitized[key] = self._sanitize_strings(value)
+        
+        # Ensure timestamp is present
+        if sanitized.get('timestamp') is None:
+            sanitized['timestamp'] = datetime.now().isoformat()
+        
+        return sanitized
+    
+    def _coerce(
+        self, 
+        value: Any, 
+        target_type: type, 
+        field: str, 
+        errors: Optional[List[ValidationError]]
+    ) -> Any:
+        """
+        Coerce a value to a numeric type.
+        
+        String values are sanitized before conversion, so injection
+        fragments around a number (as in "2000;") are dropped rather than
+        making the value fail to convert.
+        
+        Args:
+            value: Value to coerce (None is left unchanged)
+            target_type: float or int
+            field: Field path used in error reports
+            errors: If given, failures are appended here and the value is
+                returned unchanged; otherwise the conversion error is raised
+            
+        Returns:
+            Coerced value
+        """
+        # Values already of the target type (the common case) need no work
+        if value is None or type(value) is target_type:
+            return value
+        
+        if isinstance(value, str):
+            value = self._sanitize_string(value)
+        
+        try:
+            return target_type(value)
+        except (TypeError, ValueError):
+            if errors is None:
+                raise
+            errors.append(self._error(ValidationErrorCode.NOT_NUMERIC, field, value=value))
+            return value
+    
+    def _sanitize_food_item(
+        self, 
+        item: Any, 
+        path: str = 'food_items', 
+        errors: Optional[List[ValidationError]] = None
+    ) -> Any:
         """
         Sanitize a food item dictionary.
         
         Args:
             item: Food item dictionary
+            path: Field path of the item used in error reports
+            errors: If given, coercion failures are appended here instead of raised
             
         Returns:
             Sanitized food item dictionary
         """
-        sanitized = item.copy()
-        
-        # Ensure name is sanitized
-        if 'name' in sanitized:
-            sanitized['name'] = self._sanitize_string(str(sanitized['name']))
-        
-        # Ensure numeric values are properly typed
-        if 'serving_size' in sanitized:
-            sanitized['serving_size'] = float(sanitized['serving_size'])
-        
-        # Sanitize nutritional info
-        if 'nutritional_info' in sanitized:
-            nutritional = sanitized['nutritional_info']
-            for key in ['calories', 'protein', 'carbohydrates', 'fat', 'sodium', 'sugar', 'fiber']:
-                if key in nutritional:
-                    nutritional[key] = float(nutritional[key])
-            
-            if 'processing_level' in nutritional:
-                nutritional['processing_level'] = int(nutritional['processing_level'])
+        if not isinstance(item, dict):
+            return self._sanitize_strings(item)
+        
+        sanitized: Dict[str, Any] = {}
+        
+        for key, value in item.items():
+            if key == 'name':
+                sanitized[key] = self._sanitize_string(str(value))
+            elif key in self.FOOD_ITEM_NUMERIC_FIELDS:
+                sanitized[key] = self._coerce(
+                    value, self.FOOD_ITEM_NUMERIC_FIELDS[key], f'{path}.{key}', errors
+                )
+            elif key == 'nutritional_info' and isinstance(value, dict):
+                sanitized[key] = self._sanitize_nutritional_info(value, f'{path}.{key}', errors)
+            else:
+                sanitized[key] = self._sanitize_strings(value)
+        
+        return sanitized
+    
+    def _sanitize_nutritional_info(
+        self, 
+        nutritional: Dict[str, Any], 
+        path: str, 
+        errors: Optional[List[ValidationError]] = None
+    ) -> Dict[str, Any]:
+        """
+        Sanitize a nutritional info dictionary.
+        
+        Args:
+            nutritional: Nutritional info dictionary
+            path: Field path of the dictionary used in error reports
+            errors: If given, coercion failures are appended here instead of raised
             
-            if 'preservatives' in nutritional and isinstance(nutritional['preservatives'], list):
-                nutritional['preservatives'] = [
-                    self._sanitize_string(str(p)) for p in nutritional['preservatives']
-                ]
+        Returns:
+            Sanitized nutritional info dictionary
+        """
+        sanitized: Dict[str, Any] = {}
+        
+        for key, value in nutritional.items():
+            if key in self.NUTRITIONAL_NUMERIC_FIELDS:
+                sanitized[key] = self._coerce(
+                    value, self.NUTRITIONAL_NUMERIC_FIELDS[key], f'{path}.{key}', errors
+                )
+            elif key == 'preservatives' and isinstance(value, list):
+                sanitized[key] = [self._sanitize_string(str(p)) for p in value]
+            else:
+                sanitized[key] = self._sanitize_strings(value)
         
         return sanitized
     
-    def _sanitize_habit(self, habit: Dict[str, Any]) -> Dict[str, Any]:
+    def _sanitize_habit(
+        self, 
+        habit: Any, 
+        path: str = 'daily_habits', 
+        errors: Optional[List[ValidationError]] = None
+    ) -> Any:
         """
         Sanitize a habit dictionary.
         
         Args:
             habit: Habit dictionary
+            path: Field path of the habit used in error reports
+            errors: If given, coercion failures are appended here instead of raised
             
         Returns:
             Sanitized habit dictionary
         """
-        sanitized = habit.copy()
+        if not isinstance(habit, dict):
+            return self._sanitize_strings(habit)
         
-        # Ensure intensity is an integer
-        if 'intensity' in sanitized:
-            sanitized['intensity'] = int(sanitized['intensity'])
+        sanitized: Dict[str, Any] = {}
         
-        # Ensure duration is a float if present
-        if 'duration' in sanitized and sanitized['duration'] is not None:
-            sanitized['duration'] = float(sanitized['duration'])
-        
-        # Sanitize notes if present
-        if 'notes' in sanitized and sanitized['notes'] is not None:
-            sanitized['notes'] = self._sanitize_string(str(sanitized['notes']))
+        for key, value in habit.items():
+            if key in self.HABIT_NUMERIC_FIELDS:
+                sanitized[key] = self._coerce(
+                    value, self.HABIT_NUMERIC_FIELDS[key], f'{path}.{key}', errors
+                )
+            elif key == 'notes' and value is not None:
+                sanitized[key] = self._sanitize_string(str(value))
+            else:
+                sanitized[key] = self._sanitize_strings(value)
         
         return sanitized
     
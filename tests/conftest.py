@@ -1,7 +1,11 @@
 """Pytest configuration and shared fixtures."""
 
+import os
+
 import pytest
 from datetime import datetime, time
+from hypothesis import settings, HealthCheck, Phase
+from hypothesis.database import DirectoryBasedExampleDatabase
 from jeevanfit.models import (
     FoodItem,
     NutritionalInfo,
@@ -14,7 +18,47 @@ from jeevanfit.models import (
 )
 
 
-@pytest.fixture
+# Hypothesis profiles, opt-in with the HYPOTHESIS_PROFILE environment variable;
+# without it Hypothesis's own defaults apply. "fast" is for quick local runs:
+# fewer derandomized examples, no example database and no shrinking; "ci"
+# draws randomly and replays saved failing examples from a directory that CI
+# can persist between runs (HYPOTHESIS_DATABASE_DIR), which derandomized runs
+# would never read; "nightly" runs a much larger random budget. Tests that set
+# max_examples explicitly keep their own budget.
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    deadline=None,
+    derandomize=True,
+    database=None,
+    suppress_health_check=[HealthCheck.too_slow],
+    phases=[Phase.explicit, Phase.generate],
+)
+settings.register_profile(
+    "ci",
+    max_examples=50,
+    deadline=500,
+    derandomize=False,
+    database=DirectoryBasedExampleDatabase(
+        os.environ.get("HYPOTHESIS_DATABASE_DIR", ".hypothesis/examples")
+    ),
+)
+settings.register_profile("nightly", max_examples=500, deadline=None, derandomize=False)
+if "HYPOTHESIS_PROFILE" in os.environ:
+    settings.load_profile(os.environ["HYPOTHESIS_PROFILE"])
+
+
+@pytest.fixture(scope="session")
+def rand_keys():
+    """Two distinct random AES-256 keys, generated once per session."""
+    return os.urandom(32), os.urandom(32)
+
+
+# The model samples below are read-only in the tests, so the basic ones are
+# built once per session. Copy them before mutating.
+
+
+@pytest.fixture(scope="session")
 def sample_nutritional_info():
     """Sample nutritional information."""
     return NutritionalInfo(
@@ -30,7 +74,7 @@ def sample_nutritional_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_food_item(sample_nutritional_info):
     """Sample food item."""
     return FoodItem(
@@ -41,7 +85,7 @@ def sample_food_item(sample_nutritional_info):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sleep_data():
     """Sample sleep data."""
     return SleepData(
@@ -54,7 +98,7 @@ def sample_sleep_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_habit():
     """Sample habit."""
     return Habit(
@@ -1,21 +1,24 @@
 """Unit tests for InputValidator."""
 
+import operator
+
 import pytest
 from datetime import datetime, time
-from hypothesis import given, strategies as st
+from hypothesis import given, strategies as st, settings, HealthCheck
 
 from jeevanfit.validators import InputValidator
-from jeevanfit.models.core import ValidationResult, ValidationError
+from jeevanfit.models.core import ValidationResult, ValidationError, ValidationErrorCode
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Shared InputValidator instance (the validator holds no per-call state)."""
+    return InputValidator()
 
 
 class TestInputValidator:
     """Tests for InputValidator class."""
 
-    @pytest.fixture
-    def validator(self):
-        """Create an InputValidator instance."""
-        return InputValidator()
-
     @pytest.fixture
     def valid_input_dict(self):
         """Valid input dictionary for testing."""
@@ -87,6 +90,53 @@ class TestInputValidator:
         assert len(result.errors) > 0
         assert any(error.field == 'water_intake' for error in result.errors)
 
+    def test_validate_fail_fast_stops_at_missing_required(self, validator):
+        """Test fail_fast reports only the missing required fields."""
+        input_data = {
+            'water_intake': 2000,
+            'food_items': []
+        }
+        result = validator.validate_input(input_data, fail_fast=True)
+        
+        assert result.is_valid is False
+        assert [error.field for error in result.errors] == ['user_id']
+
+    def test_validate_collects_all_errors_by_default(self, validator):
+        """Test validation reports every top-level problem without fail_fast."""
+        input_data = {
+            'water_intake': 2000,
+            'food_items': []
+        }
+        result = validator.validate_input(input_data)
+        
+        assert {error.field for error in result.errors} == {'user_id', 'general'}
+
+    def test_validate_errors_carry_codes(self, validator):
+        """Test validation errors report their kind through the error code."""
+        input_data = {
+            'water_intake': 'lots',
+            'sleep_data': {
+                'duration': 7.5,
+                'quality': 8,
+                'bedtime': '22:30:00',
+                'wake_time': '06:00:00',
+                'interruptions': 1,
+                'timestamp': '2024-02-14T06:00:00'
+            }
+        }
+        result = validator.validate_input(input_data)
+        
+        assert [(error.field, error.code) for error in result.errors] == [
+            ('user_id', ValidationErrorCode.MISSING_REQUIRED)
+        ]
+        
+        input_data['user_id'] = 'user-123'
+        result = validator.validate_input(input_data)
+        
+        assert [(error.field, error.code) for error in result.errors] == [
+            ('water_intake', ValidationErrorCode.INVALID_VALUE)
+        ]
+
     def test_validate_empty_input(self, validator):
         """Test validation fails when no meaningful data is provided."""
         empty_input = {
@@ -115,7 +165,7 @@ class TestInputValidator:
         result = validator.validate_input(valid_input_dict)
         
         assert result.is_valid is False
-        assert any('inconsistent' in error.message.lower() for error in result.errors)
+        assert any(error.code is ValidationErrorCode.INCONSISTENT_SLEEP for error in result.errors)
 
     def test_validate_duplicate_food_items(self, validator, valid_input_dict):
         """Test validation detects duplicate food items."""
@@ -124,7 +174,7 @@ class TestInputValidator:
         result = validator.validate_input(valid_input_dict)
         
         assert result.is_valid is False
-        assert any('duplicate' in error.message.lower() for error in result.errors)
+        assert any(error.code is ValidationErrorCode.DUPLICATE_FOOD_ITEMS for error in result.errors)
 
     def test_sanitize_input_basic(self, validator):
         """Test basic input sanitization."""
@@ -632,6 +682,44 @@ class TestInputValidator:
         # Shell operators should be removed
         assert '&&' not in sanitized['daily_habits'][0]['notes']
 
+    @pytest.mark.parametrize("payload,expected", [
+        ('javajavascript:script:alert(1)', 'alert(1)'),
+        ('$$((rm -rf x))', 'rm -rf x))'),
+    ])
+    def test_sanitize_nested_injection_patterns(self, validator, payload, expected):
+        """Test sanitization removes patterns spliced together by an earlier removal."""
+        input_data = {
+            'user_id': 'user-123',
+            'water_intake': 2000,
+            'food_items': [
+                {
+                    'name': payload,
+                    'serving_size': 1,
+                    'unit': 'serving',
+                    'nutritional_info': {
+                        'calories': 200, 'protein': 5, 'carbohydrates': 30,
+                        'fat': 8, 'sodium': 400, 'sugar': 5, 'fiber': 2,
+                        'preservatives': [payload],
+                        'processing_level': 3
+                    }
+                }
+            ],
+            'daily_habits': [
+                {
+                    'type': 'other',
+                    'intensity': 5,
+                    'notes': payload
+                }
+            ]
+        }
+        
+        sanitized = validator.sanitize_input(input_data)
+        
+        food_item = sanitized['food_items'][0]
+        assert food_item['name'] == expected
+        assert food_item['nutritional_info']['preservatives'] == [expected]
+        assert sanitized['daily_habits'][0]['notes'] == expected
+
     def test_sanitize_special_characters_in_preservatives(self, validator):
         """Test sanitization handles special characters in preservatives list.
         
@@ -800,61 +888,134 @@ class TestInputValidator:
         assert isinstance(sanitized['food_items'][0]['nutritional_info']['calories'], float)
         assert isinstance(sanitized['food_items'][0]['nutritional_info']['processing_level'], int)
 
+    def test_sanitize_numeric_strings_with_injection_patterns(self, validator):
+        """Test numeric strings are sanitized before they are converted."""
+        input_data = {
+            'user_id': 'user-123',
+            'water_intake': '2000;',
+            'food_items': [
+                {
+                    'name': 'Apple',
+                    'serving_size': '1 && ',
+                    'unit': 'medium',
+                    'nutritional_info': {
+                        'calories': 'SELECT 5',
+                        'protein': '0.5',
+                        'carbohydrates': '25',
+                        'fat': '0.3',
+                        'sodium': '2',
+                        'sugar': '19',
+                        'fiber': '4',
+                        'preservatives': [],
+                        'processing_level': '1;'
+                    }
+                }
+            ],
+            'daily_habits': [
+                {
+                    'type': 'other',
+                    'intensity': '5;',
+                    'duration': 'DROP 1.5'
+                }
+            ]
+        }
+        
+        sanitized = validator.sanitize_input(input_data)
+        
+        assert sanitized['water_intake'] == 2000.0
+        food_item = sanitized['food_items'][0]
+        assert food_item['serving_size'] == 1.0
+        assert food_item['nutritional_info']['calories'] == 5.0
+        assert food_item['nutritional_info']['processing_level'] == 1
+        assert sanitized['daily_habits'][0]['intensity'] == 5
+        assert sanitized['daily_habits'][0]['duration'] == 1.5
 
-# Property-Based Tests
-
-# Hypothesis strategies for generating test data
-@st.composite
-def nutritional_info_strategy(draw):
-    """Generate valid nutritional info."""
-    return {
-        'calories': draw(st.floats(min_value=0, max_value=5000)),
-        'protein': draw(st.floats(min_value=0, max_value=200)),
-        'carbohydrates': draw(st.floats(min_value=0, max_value=500)),
-        'fat': draw(st.floats(min_value=0, max_value=200)),
-        'sodium': draw(st.floats(min_value=0, max_value=5000)),
-        'sugar': draw(st.floats(min_value=0, max_value=200)),
-        'fiber': draw(st.floats(min_value=0, max_value=100)),
-        'preservatives': draw(st.lists(st.text(min_size=1, max_size=20), max_size=5)),
-        'processing_level': draw(st.integers(min_value=1, max_value=5))
-    }
-
-
-@st.composite
-def food_item_strategy(draw):
-    """Generate valid food item."""
-    return {
-        'name': draw(st.text(min_size=1, max_size=50).filter(lambda x: x.strip())),
-        'serving_size': draw(st.floats(min_value=0.1, max_value=1000)),
-        'unit': draw(st.sampled_from(['g', 'ml', 'cup', 'piece', 'slice', 'oz'])),
-        'nutritional_info': draw(nutritional_info_strategy())
-    }
+    def test_sanitize_and_validate_valid_input(self, validator, valid_input_dict):
+        """Test combined sanitization and validation of valid input."""
+        valid_input_dict['water_intake'] = '2000'
+        valid_input_dict['daily_habits'][0]['notes'] = '  Afternoon   coffee '
+        
+        sanitized, result = validator.sanitize_and_validate(valid_input_dict)
+        
+        assert sanitized['water_intake'] == 2000.0
+        assert sanitized['daily_habits'][0]['notes'] == 'Afternoon coffee'
+        assert result.is_valid is True
+        assert result.validated_data.water_intake == 2000.0
 
+    def test_sanitize_and_validate_reports_non_numeric_values(self, validator, valid_input_dict):
+        """Test combined path reports uncoercible numbers instead of raising."""
+        valid_input_dict['food_items'][0]['nutritional_info']['calories'] = 'lots'
+        
+        sanitized, result = validator.sanitize_and_validate(valid_input_dict)
+        
+        assert result.is_valid is False
+        assert result.validated_data is None
+        assert any(
+            error.field == 'food_items.0.nutritional_info.calories'
+            for error in result.errors
+        )
+        assert sanitized['food_items'][0]['nutritional_info']['calories'] == 'lots'
 
-@st.composite
-def sleep_data_strategy(draw):
-    """Generate valid sleep data."""
-    return {
-        'duration': draw(st.floats(min_value=0, max_value=24)),
-        'quality': draw(st.integers(min_value=1, max_value=10)),
-        'bedtime': draw(st.times()),
-        'wake_time': draw(st.times()),
-        'interruptions': draw(st.integers(min_value=0, max_value=20)),
-        'timestamp': draw(st.datetimes(min_value=datetime(2020, 1, 1), max_value=datetime(2030, 12, 31)))
-    }
 
+# Property-Based Tests
 
-@st.composite
-def habit_strategy(draw):
-    """Generate valid habit."""
-    habit_types = ['exercise', 'stress', 'screen_time', 'caffeine', 'alcohol', 'other']
-    return {
-        'type': draw(st.sampled_from(habit_types)),
-        'intensity': draw(st.integers(min_value=1, max_value=10)),
-        'duration': draw(st.one_of(st.none(), st.floats(min_value=0, max_value=24))),
-        'timing': draw(st.one_of(st.none(), st.times())),
-        'notes': draw(st.one_of(st.none(), st.text(max_size=200)))
-    }
+# Hypothesis strategies for generating test data
+# Plain dict factories are flat fixed_dictionaries; only the strategies with
+# conditional logic remain composites.
+# Non-blank text generated directly rather than by filtering st.text()
+_NON_BLANK_TEXT = st.from_regex(r"\S[\S ]{0,49}", fullmatch=True)
+_WATER = st.floats(min_value=0, max_value=10000)
+_DT_MIN = datetime(2020, 1, 1)
+_DT_MAX = datetime(2030, 12, 31)
+_DT_STRATEGY = st.datetimes(min_value=_DT_MIN, max_value=_DT_MAX)
+_HABIT_TYPES = ('exercise', 'stress', 'screen_time', 'caffeine', 'alcohol', 'other')
+_HABIT_TYPES_STRATEGY = st.sampled_from(_HABIT_TYPES)
+_INVALID_TYPES = st.sampled_from([
+    'missing_user_id',
+    'missing_water_intake',
+    'empty_data',
+    'invalid_water_intake',
+    'invalid_sleep_duration',
+    'inconsistent_sleep',
+    'negative_values',
+    'extreme_values'
+])
+
+nutritional_info_strategy = st.fixed_dictionaries({
+    'calories': st.floats(min_value=0, max_value=5000),
+    'protein': st.floats(min_value=0, max_value=200),
+    'carbohydrates': st.floats(min_value=0, max_value=500),
+    'fat': st.floats(min_value=0, max_value=200),
+    'sodium': st.floats(min_value=0, max_value=5000),
+    'sugar': st.floats(min_value=0, max_value=200),
+    'fiber': st.floats(min_value=0, max_value=100),
+    'preservatives': st.lists(st.text(min_size=1, max_size=20), max_size=5),
+    'processing_level': st.integers(min_value=1, max_value=5)
+})
+
+food_item_strategy = st.fixed_dictionaries({
+    'name': _NON_BLANK_TEXT,
+    'serving_size': st.floats(min_value=0.1, max_value=1000),
+    'unit': st.sampled_from(['g', 'ml', 'cup', 'piece', 'slice', 'oz']),
+    'nutritional_info': nutritional_info_strategy
+})
+
+sleep_data_strategy = st.fixed_dictionaries({
+    'duration': st.floats(min_value=0, max_value=24),
+    'quality': st.integers(min_value=1, max_value=10),
+    'bedtime': st.times(),
+    'wake_time': st.times(),
+    'interruptions': st.integers(min_value=0, max_value=20),
+    'timestamp': _DT_STRATEGY
+})
+
+habit_strategy = st.fixed_dictionaries({
+    'type': _HABIT_TYPES_STRATEGY,
+    'intensity': st.integers(min_value=1, max_value=10),
+    'duration': st.one_of(st.none(), st.floats(min_value=0, max_value=24)),
+    'timing': st.one_of(st.none(), st.times()),
+    'notes': st.one_of(st.none(), st.text(max_size=200))
+})
 
 
 @st.composite
@@ -876,12 +1037,12 @@ def lifestyle_input_strategy(draw):
             has_habits = True
     
     return {
-        'user_id': draw(st.text(min_size=1, max_size=50).filter(lambda x: x.strip())),
-        'water_intake': draw(st.floats(min_value=0, max_value=10000)),
-        'food_items': draw(st.lists(food_item_strategy(), min_size=1, max_size=5)) if has_food else [],
-        'sleep_data': draw(sleep_data_strategy()) if has_sleep else None,
-        'daily_habits': draw(st.lists(habit_strategy(), min_size=1, max_size=5)) if has_habits else [],
-        'timestamp': draw(st.datetimes(min_value=datetime(2020, 1, 1), max_value=datetime(2030, 12, 31))),
+        'user_id': draw(_NON_BLANK_TEXT),
+        'water_intake': draw(_WATER),
+        'food_items': draw(st.lists(food_item_strategy, min_size=1, max_size=5)) if has_food else [],
+        'sleep_data': draw(sleep_data_strategy) if has_sleep else None,
+        'daily_habits': draw(st.lists(habit_strategy, min_size=1, max_size=5)) if has_habits else [],
+        'timestamp': draw(_DT_STRATEGY),
         'notes': draw(st.one_of(st.none(), st.text(max_size=500)))
     }
 
@@ -890,58 +1051,74 @@ def lifestyle_input_strategy(draw):
 def invalid_lifestyle_input_strategy(draw):
     """Generate invalid or incomplete lifestyle input for error testing."""
     # Choose what kind of invalid input to generate
-    invalid_type = draw(st.sampled_from([
-        'missing_user_id',
-        'missing_water_intake',
-        'empty_data',
-        'invalid_water_intake',
-        'invalid_sleep_duration',
-        'inconsistent_sleep',
-        'negative_values',
-        'extreme_values'
-    ]))
+    invalid_type = draw(_INVALID_TYPES)
     
+    # Only draw the base fields that this kind of input keeps unchanged
     base_input = {
-        'user_id': draw(st.text(min_size=1, max_size=50).filter(lambda x: x.strip())),
-        'water_intake': draw(st.floats(min_value=0, max_value=10000)),
         'food_items': [],
         'daily_habits': []
     }
+    if invalid_type != 'missing_user_id':
+        base_input['user_id'] = draw(_NON_BLANK_TEXT)
+    if invalid_type not in ('missing_water_intake', 'invalid_water_intake', 'negative_values'):
+        base_input['water_intake'] = draw(_WATER)
     
-    if invalid_type == 'missing_user_id':
-        del base_input['user_id']
-    elif invalid_type == 'missing_water_intake':
-        del base_input['water_intake']
-    elif invalid_type == 'empty_data':
-        # No food, sleep, or habits
-        pass
-    elif invalid_type == 'invalid_water_intake':
+    if invalid_type == 'invalid_water_intake':
         base_input['water_intake'] = draw(st.floats(min_value=10001, max_value=100000))
-        base_input['food_items'] = [draw(food_item_strategy())]
+        base_input['food_items'] = [draw(food_item_strategy)]
     elif invalid_type == 'invalid_sleep_duration':
-        base_input['sleep_data'] = draw(sleep_data_strategy())
+        base_input['sleep_data'] = draw(sleep_data_strategy)
         base_input['sleep_data']['duration'] = draw(st.floats(min_value=25, max_value=100))
     elif invalid_type == 'inconsistent_sleep':
-        base_input['sleep_data'] = draw(sleep_data_strategy())
+        base_input['sleep_data'] = draw(sleep_data_strategy)
         base_input['sleep_data']['quality'] = draw(st.integers(min_value=8, max_value=10))
         base_input['sleep_data']['interruptions'] = draw(st.integers(min_value=6, max_value=20))
     elif invalid_type == 'negative_values':
         base_input['water_intake'] = draw(st.floats(min_value=-1000, max_value=-0.1))
-        base_input['food_items'] = [draw(food_item_strategy())]
+        base_input['food_items'] = [draw(food_item_strategy)]
     elif invalid_type == 'extreme_values':
-        base_input['food_items'] = [draw(food_item_strategy())]
+        base_input['food_items'] = [draw(food_item_strategy)]
         base_input['food_items'][0]['nutritional_info']['calories'] = draw(st.floats(min_value=10000, max_value=100000))
+    # 'empty_data' has no food, sleep, or habits; the missing_* kinds are
+    # handled by the base fields above
     
     return base_input
 
 
+# Helpers for checking ValidationError contents
+_get_err = operator.attrgetter('field', 'message', 'suggested_fix')
+_HELP_KW = frozenset({'please', 'provide', 'ensure', 'check', 'verify', 'valid', 'correct'})
+
+
+def _check_error(error):
+    """Assert that a validation error is descriptive and actionable."""
+    assert isinstance(error, ValidationError), "Error must be ValidationError instance"
+    
+    field, message, suggested_fix = _get_err(error)
+    assert type(field) is str and field, "Error field must be a non-empty string"
+    assert type(message) is str and len(message) >= 10, \
+        "Error message should be descriptive (at least 10 chars)"
+    assert type(suggested_fix) is str and len(suggested_fix) >= 10, \
+        "Suggested fix should be actionable (at least 10 chars)"
+    
+    # Suggested fix should contain helpful keywords
+    assert _HELP_KW & set(suggested_fix.lower().split()), \
+        f"Suggested fix should contain helpful guidance: {suggested_fix}"
+
+
+# Composite strategy instances built once and shared by the tests
+_LIFESTYLE = lifestyle_input_strategy()
+_INVALID = invalid_lifestyle_input_strategy()
+
+
 @pytest.mark.property
 class TestInputValidatorProperties:
     """Property-based tests for InputValidator."""
 
     # Feature: fitbuddy-lifestyle-assistant, Property 21: Comprehensive input validation
-    @given(lifestyle_input=lifestyle_input_strategy())
-    def test_comprehensive_input_validation(self, lifestyle_input):
+    @given(lifestyle_input=_LIFESTYLE)
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_comprehensive_input_validation(self, validator, lifestyle_input):
         """
         Property 21: Comprehensive input validation
         
@@ -951,7 +1128,6 @@ class TestInputValidatorProperties:
         
         Validates: Requirements 6.1, 6.2
         """
-        validator = InputValidator()
         result = validator.validate_input(lifestyle_input)
         
         # Result must be a ValidationResult
@@ -994,13 +1170,13 @@ class TestInputValidatorProperties:
         
         # Validator must check for required fields
         # If user_id or water_intake is missing, validation should fail
-        if 'user_id' not in lifestyle_input or lifestyle_input.get('user_id') is None:
+        if lifestyle_input.get('user_id') is None:
             assert not result.is_valid
-            assert any('user_id' in error.field for error in result.errors)
+            assert result.errors_by_field.get('user_id')
         
-        if 'water_intake' not in lifestyle_input or lifestyle_input.get('water_intake') is None:
+        if lifestyle_input.get('water_intake') is None:
             assert not result.is_valid
-            assert any('water_intake' in error.field for error in result.errors)
+            assert result.errors_by_field.get('water_intake')
         
         # Validator must check for at least one meaningful data field
         has_food = lifestyle_input.get('food_items') and len(lifestyle_input.get('food_items', [])) > 0
@@ -1011,8 +1187,9 @@ class TestInputValidatorProperties:
             assert not result.is_valid
 
     # Feature: fitbuddy-lifestyle-assistant, Property 22: Input validation error handling
-    @given(invalid_input=invalid_lifestyle_input_strategy())
-    def test_input_validation_error_handling(self, invalid_input):
+    @given(invalid_input=_INVALID)
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_input_validation_error_handling(self, validator, invalid_input):
         """
         Property 22: Input validation error handling
         
@@ -1022,7 +1199,6 @@ class TestInputValidatorProperties:
         
         Validates: Requirements 6.3, 6.5
         """
-        validator = InputValidator()
         result = validator.validate_input(invalid_input)
         
         # Result must be a ValidationResult
@@ -1035,49 +1211,22 @@ class TestInputValidatorProperties:
         
         # Each error must have all required fields with meaningful content
         for error in result.errors:
-            # Error must be a ValidationError instance
-            assert isinstance(error, ValidationError), "Error must be ValidationError instance"
-            
-            # Field must be specified and non-empty
-            assert error.field is not None, "Error field must not be None"
-            assert isinstance(error.field, str), "Error field must be a string"
-            assert len(error.field) > 0, "Error field must not be empty"
-            
-            # Message must be descriptive and non-empty
-            assert error.message is not None, "Error message must not be None"
-            assert isinstance(error.message, str), "Error message must be a string"
-            assert len(error.message) > 0, "Error message must not be empty"
-            assert len(error.message) >= 10, "Error message should be descriptive (at least 10 chars)"
-            
-            # Suggested fix must be present and actionable
-            assert error.suggested_fix is not None, "Error suggested_fix must not be None"
-            assert isinstance(error.suggested_fix, str), "Error suggested_fix must be a string"
-            assert len(error.suggested_fix) > 0, "Error suggested_fix must not be empty"
-            assert len(error.suggested_fix) >= 10, "Suggested fix should be actionable (at least 10 chars)"
-            
-            # Suggested fix should contain helpful keywords
-            helpful_keywords = ['please', 'provide', 'ensure', 'check', 'verify', 'valid', 'correct']
-            assert any(keyword in error.suggested_fix.lower() for keyword in helpful_keywords), \
-                f"Suggested fix should contain helpful guidance: {error.suggested_fix}"
+            _check_error(error)
         
         # Verify specific error conditions are properly detected
         
         # Missing user_id should be caught
-        if 'user_id' not in invalid_input or invalid_input.get('user_id') is None:
-            assert any('user_id' in error.field for error in result.errors), \
-                "Missing user_id should be detected"
-            user_id_errors = [e for e in result.errors if 'user_id' in e.field]
-            assert any('missing' in e.message.lower() or 'required' in e.message.lower() 
-                      for e in user_id_errors), \
+        if invalid_input.get('user_id') is None:
+            user_id_errors = result.errors_by_field.get('user_id', [])
+            assert user_id_errors, "Missing user_id should be detected"
+            assert any(e.code is ValidationErrorCode.MISSING_REQUIRED for e in user_id_errors), \
                 "user_id error should mention it's missing or required"
         
         # Missing water_intake should be caught
-        if 'water_intake' not in invalid_input or invalid_input.get('water_intake') is None:
-            assert any('water_intake' in error.field for error in result.errors), \
-                "Missing water_intake should be detected"
-            water_errors = [e for e in result.errors if 'water_intake' in e.field]
-            assert any('missing' in e.message.lower() or 'required' in e.message.lower() 
-                      for e in water_errors), \
+        if invalid_input.get('water_intake') is None:
+            water_errors = result.errors_by_field.get('water_intake', [])
+            assert water_errors, "Missing water_intake should be detected"
+            assert any(e.code is ValidationErrorCode.MISSING_REQUIRED for e in water_errors), \
                 "water_intake error should mention it's missing or required"
         
         # Empty data (no food, sleep, or habits) should be caught
@@ -1086,7 +1235,7 @@ class TestInputValidatorProperties:
         has_habits = invalid_input.get('daily_habits') and len(invalid_input.get('daily_habits', [])) > 0
         
         if not (has_food or has_sleep or has_habits):
-            assert any('at least one' in error.message.lower() for error in result.errors), \
+            assert any(error.code is ValidationErrorCode.NO_MEANINGFUL_DATA for error in result.errors), \
                 "Empty data should produce error about needing at least one data type"
         
         # Inconsistent sleep data should be caught
@@ -1096,6 +1245,26 @@ class TestInputValidatorProperties:
                 quality = sleep.get('quality', 0)
                 interruptions = sleep.get('interruptions', 0)
                 if quality >= 8 and interruptions > 5:
-                    assert any('inconsistent' in error.message.lower() or 'sleep' in error.field.lower() 
+                    assert any(error.code is ValidationErrorCode.INCONSISTENT_SLEEP
+                              or 'sleep' in error.field.lower()
                               for error in result.errors), \
                         "Inconsistent sleep quality and interruptions should be detected"
+
+    @given(lifestyle_input=st.one_of(_LIFESTYLE, _INVALID))
+    @settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_sanitize_and_validate_matches_separate_calls(self, validator, lifestyle_input):
+        """
+        The combined sanitize_and_validate path must produce the same
+        sanitized data and validation result as calling sanitize_input
+        followed by validate_input.
+        
+        Validates: Requirements 6.1, 6.2
+        """
+        lifestyle_input.setdefault('timestamp', datetime(2024, 1, 1, 12, 0))
+        
+        sanitized, result = validator.sanitize_and_validate(lifestyle_input)
+        expected_sanitized = validator.sanitize_input(lifestyle_input)
+        expected_result = validator.validate_input(expected_sanitized)
+        
+        assert sanitized == expected_sanitized
+        assert result.model_dump() == expected_result.model_dump()
@@ -11,23 +11,46 @@ from jeevanfit.insights import (
 )
 
 
+@pytest.fixture(scope="module")
+def _shared_generator():
+    """InsightGenerator instance built once for the module."""
+    return InsightGenerator()
+
+
+@pytest.fixture
+def generator(_shared_generator):
+    """Shared InsightGenerator with its insight cache emptied for each test."""
+    _shared_generator._cache.clear()
+    return _shared_generator
+
+
+@pytest.fixture(scope="module")
+def now():
+    """Fixed timestamp for analysis results."""
+    return datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def mk_result(now):
+    """Factory for AnalysisResult objects stamped with the fixed timestamp."""
+    def _mk(source, confidence=80.0, data=None):
+        return AnalysisResult(
+            source=source,
+            data=data if data is not None else {},
+            confidence=confidence,
+            timestamp=now
+        )
+    return _mk
+
+
 class TestInsightGenerator:
     """Test suite for InsightGenerator class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.generator = InsightGenerator()
-    
-    def test_generate_insight_single_source(self):
+    def test_generate_insight_single_source(self, generator, mk_result):
         """Test generating insight from a single analysis result."""
-        result = AnalysisResult(
-            source=AnalysisSource.FOOD,
-            data={"category": "healthy"},
-            confidence=85.0,
-            timestamp=datetime.now()
-        )
+        result = mk_result(AnalysisSource.FOOD, 85.0, {"category": "healthy"})
         
-        insight = self.generator.generate_insight([result])
+        insight = generator.generate_insight([result])
         
         assert insight.title == "Food Classification Insight"
         assert insight.category == "Nutrition"
@@ -37,69 +60,77 @@ class TestInsightGenerator:
         assert isinstance(insight.details, str)
         assert len(insight.details) > 0
     
-    def test_generate_insight_multiple_sources(self):
+    def test_generate_insight_multiple_sources(self, generator, mk_result):
         """Test generating insight from multiple analysis results."""
         results = [
-            AnalysisResult(
-                source=AnalysisSource.FOOD,
-                data={"category": "junk"},
-                confidence=90.0,
-                timestamp=datetime.now()
-            ),
-            AnalysisResult(
-                source=AnalysisSource.WATER,
-                data={"level": "high"},
-                confidence=85.0,
-                timestamp=datetime.now()
-            ),
-            AnalysisResult(
-                source=AnalysisSource.SLEEP,
-                data={"quality": "poor"},
-                confidence=80.0,
-                timestamp=datetime.now()
-            )
+            mk_result(AnalysisSource.FOOD, 90.0, {"category": "junk"}),
+            mk_result(AnalysisSource.WATER, 85.0, {"level": "high"}),
+            mk_result(AnalysisSource.SLEEP, 80.0, {"quality": "poor"})
         ]
         
-        insight = self.generator.generate_insight(results)
+        insight = generator.generate_insight(results)
         
         assert insight.priority == InsightPriority.HIGH  # High confidence + 3 sources
         assert "3 sources" in insight.summary
         assert len(insight.details) > 0
     
-    def test_generate_insight_empty_results_raises_error(self):
+    def test_generate_insight_empty_results_raises_error(self, generator):
         """Test that empty results raise ValueError."""
         with pytest.raises(ValueError, match="Cannot generate insight from empty"):
-            self.generator.generate_insight([])
+            generator.generate_insight([])
     
-    def test_generate_insight_determines_primary_source(self):
+    def test_generate_insight_determines_primary_source(self, generator, mk_result):
         """Test that primary source is determined by highest confidence."""
         results = [
-            AnalysisResult(
-                source=AnalysisSource.FOOD,
-                data={},
-                confidence=70.0,
-                timestamp=datetime.now()
-            ),
-            AnalysisResult(
-                source=AnalysisSource.SLEEP,
-                data={},
-                confidence=95.0,
-                timestamp=datetime.now()
-            )
+            mk_result(AnalysisSource.FOOD, 70.0),
+            mk_result(AnalysisSource.SLEEP, 95.0)
         ]
         
-        insight = self.generator.generate_insight(results)
+        insight = generator.generate_insight(results)
         
         # Primary source should be SLEEP (highest confidence)
         assert insight.title == "Sleep Quality Insight"
         assert insight.category == "Sleep & Recovery"
     
-    def test_prioritize_insights_empty_list(self):
+    def test_generate_insight_reuses_cached_insight(self, generator, mk_result, monkeypatch):
+        """Test that repeated inputs hit the cache and return independent insights."""
+        summaries = []
+        generate_summary = generator._generate_summary
+        monkeypatch.setattr(
+            generator, "_generate_summary",
+            lambda results: summaries.append(results) or generate_summary(results)
+        )
+        result = mk_result(AnalysisSource.WATER, 75.0, {"level": "high"})
+        
+        first = generator.generate_insight([result])
+        first.related_insights.append("insight-1")
+        cache_size = len(generator._cache)
+        second = generator.generate_insight([result])
+        
+        # The second call is a hit: nothing is regenerated or added
+        assert len(summaries) == 1
+        assert len(generator._cache) == cache_size
+        assert second is not first
+        assert second.title == first.title
+        assert second.details == first.details
+        assert second.related_insights == []
+    
+    def test_generate_insight_cache_respects_actionability(self, generator, mk_result):
+        """Test that cached insights are not shared across actionability."""
+        plain = mk_result(AnalysisSource.SLEEP, 80.0)
+        actionable = mk_result(AnalysisSource.SLEEP, 80.0, {"recommendations": ["Get more sleep"]})
+        
+        assert generator.generate_insight([plain]).actionable is False
+        assert generator.generate_insight([actionable]).actionable is True
+        assert (((AnalysisSource.SLEEP, 80.0),), False) in generator._cache
+        assert (((AnalysisSource.SLEEP, 80.0),), True) in generator._cache
+    
+    def test_prioritize_insights_empty_list(self, generator):
         """Test prioritizing empty list returns empty list."""
-        result = self.generator.prioritize_insights([])
+        result = generator.prioritize_insights([])
         assert result == []
     
-    def test_prioritize_insights_sorts_by_priority(self):
+    def test_prioritize_insights_sorts_by_priority(self, generator):
         """Test that insights are sorted by priority."""
         insights = [
             Insight(
@@ -131,13 +162,13 @@ class TestInsightGenerator:
             )
         ]
         
-        sorted_insights = self.generator.prioritize_insights(insights)
+        sorted_insights = generator.prioritize_insights(insights)
         
         assert sorted_insights[0].priority == InsightPriority.HIGH
         assert sorted_insights[1].priority == InsightPriority.MEDIUM
         assert sorted_insights[2].priority == InsightPriority.LOW
     
-    def test_prioritize_insights_considers_actionability(self):
+    def test_prioritize_insights_considers_actionability(self, generator):
         """Test that actionable insights are prioritized within same priority level."""
         insights = [
             Insight(
@@ -160,13 +191,13 @@ class TestInsightGenerator:
             )
         ]
         
-        sorted_insights = self.generator.prioritize_insights(insights)
+        sorted_insights = generator.prioritize_insights(insights)
         
         # Actionable should come first
         assert sorted_insights[0].actionable is True
         assert sorted_insights[1].actionable is False
     
-    def test_prioritize_insights_filters_redundant(self):
+    def test_prioritize_insights_filters_redundant(self, generator):
         """Test that redundant insights are filtered out."""
         insights = [
             Insight(
@@ -189,102 +220,94 @@ class TestInsightGenerator:
             )
         ]
         
-        filtered_insights = self.generator.prioritize_insights(insights)
+        filtered_insights = generator.prioritize_insights(insights)
         
         # Should only keep one insight with same category and similar title
         assert len(filtered_insights) == 1
     
-    def test_is_actionable_with_recommendations_dict(self):
+    def test_prioritize_insights_keeps_highest_priority_duplicate(self, generator):
+        """Test that filtering keeps the highest-priority redundant insight."""
+        insights = [
+            Insight(
+                title="hydration insight",
+                summary="Summary 1",
+                details="Details 1",
+                priority=InsightPriority.LOW,
+                category="Hydration",
+                actionable=False,
+                related_insights=[]
+            ),
+            Insight(
+                title="Hydration Insight",
+                summary="Summary 2",
+                details="Details 2",
+                priority=InsightPriority.HIGH,
+                category="Hydration",
+                actionable=True,
+                related_insights=[]
+            )
+        ]
+        
+        filtered_insights = generator.prioritize_insights(insights)
+        
+        assert len(filtered_insights) == 1
+        assert filtered_insights[0].priority == InsightPriority.HIGH
+    
+    def test_is_actionable_with_recommendations_dict(self, generator, mk_result):
         """Test actionability detection with recommendations in dict."""
         results = [
-            AnalysisResult(
-                source=AnalysisSource.SLEEP,
-                data={"recommendations": ["Get more sleep"]},
-                confidence=80.0,
-                timestamp=datetime.now()
-            )
+            mk_result(AnalysisSource.SLEEP, 80.0, {"recommendations": ["Get more sleep"]})
         ]
         
-        insight = self.generator.generate_insight(results)
+        insight = generator.generate_insight(results)
         assert insight.actionable is True
     
-    def test_is_actionable_with_recommendations_attribute(self):
+    def test_is_actionable_with_recommendations_attribute(self, generator, mk_result):
         """Test actionability detection with recommendations attribute."""
         class MockData:
             def __init__(self):
                 self.recommendations = ["Drink more water"]
         
         results = [
-            AnalysisResult(
-                source=AnalysisSource.WATER,
-                data=MockData(),
-                confidence=80.0,
-                timestamp=datetime.now()
-            )
+            mk_result(AnalysisSource.WATER, 80.0, MockData())
         ]
         
-        insight = self.generator.generate_insight(results)
+        insight = generator.generate_insight(results)
         assert insight.actionable is True
     
-    def test_is_actionable_without_recommendations(self):
+    def test_is_actionable_without_recommendations(self, generator, mk_result):
         """Test actionability detection without recommendations."""
         results = [
-            AnalysisResult(
-                source=AnalysisSource.TREND,
-                data={"pattern": "increasing"},
-                confidence=80.0,
-                timestamp=datetime.now()
-            )
+            mk_result(AnalysisSource.TREND, 80.0, {"pattern": "increasing"})
         ]
         
-        insight = self.generator.generate_insight(results)
+        insight = generator.generate_insight(results)
         assert insight.actionable is False
     
-    def test_priority_high_with_high_confidence_and_multiple_sources(self):
-        """Test HIGH priority assignment with high confidence and 3+ sources."""
-        results = [
-            AnalysisResult(source=AnalysisSource.FOOD, data={}, confidence=85.0, timestamp=datetime.now()),
-            AnalysisResult(source=AnalysisSource.WATER, data={}, confidence=80.0, timestamp=datetime.now()),
-            AnalysisResult(source=AnalysisSource.SLEEP, data={}, confidence=75.0, timestamp=datetime.now())
-        ]
-        
-        insight = self.generator.generate_insight(results)
-        assert insight.priority == InsightPriority.HIGH
-    
-    def test_priority_medium_with_moderate_confidence(self):
-        """Test MEDIUM priority assignment with moderate confidence."""
-        results = [
-            AnalysisResult(source=AnalysisSource.FOOD, data={}, confidence=65.0, timestamp=datetime.now())
-        ]
-        
-        insight = self.generator.generate_insight(results)
-        assert insight.priority == InsightPriority.MEDIUM
-    
-    def test_priority_low_with_low_confidence_single_source(self):
-        """Test LOW priority assignment with low confidence and single source."""
-        results = [
-            AnalysisResult(source=AnalysisSource.TREND, data={}, confidence=50.0, timestamp=datetime.now())
-        ]
+    @pytest.mark.parametrize("sources,expected", [
+        # High confidence and 3+ sources
+        ([(AnalysisSource.FOOD, 85.0), (AnalysisSource.WATER, 80.0), (AnalysisSource.SLEEP, 75.0)],
+         InsightPriority.HIGH),
+        # Moderate confidence
+        ([(AnalysisSource.FOOD, 65.0)], InsightPriority.MEDIUM),
+        # Low confidence and a single source
+        ([(AnalysisSource.TREND, 50.0)], InsightPriority.LOW),
+    ], ids=["high", "medium", "low"])
+    def test_priority_assignment(self, generator, mk_result, sources, expected):
+        """Test priority assignment from confidence and number of sources."""
+        results = [mk_result(source, confidence) for source, confidence in sources]
         
-        insight = self.generator.generate_insight(results)
-        assert insight.priority == InsightPriority.LOW
+        insight = generator.generate_insight(results)
+        assert insight.priority == expected
     
-    def test_category_mapping_for_all_sources(self):
-        """Test that all source types map to correct categories."""
-        source_category_map = {
-            AnalysisSource.FOOD: "Nutrition",
-            AnalysisSource.WATER: "Hydration",
-            AnalysisSource.SLEEP: "Sleep & Recovery",
-            AnalysisSource.BODY_TYPE: "Metabolism",
-            AnalysisSource.TREND: "Lifestyle Patterns"
-        }
-        
-        for source, expected_category in source_category_map.items():
-            result = AnalysisResult(
-                source=source,
-                data={},
-                confidence=80.0,
-                timestamp=datetime.now()
-            )
-            insight = self.generator.generate_insight([result])
-            assert insight.category == expected_category
+    @pytest.mark.parametrize("source,expected", [
+        (AnalysisSource.FOOD, "Nutrition"),
+        (AnalysisSource.WATER, "Hydration"),
+        (AnalysisSource.SLEEP, "Sleep & Recovery"),
+        (AnalysisSource.BODY_TYPE, "Metabolism"),
+        (AnalysisSource.TREND, "Lifestyle Patterns"),
+    ])
+    def test_category_mapping_for_all_sources(self, generator, mk_result, source, expected):
+        """Test that each source type maps to the correct category."""
+        insight = generator.generate_insight([mk_result(source)])
+        assert insight.category == expected
@@ -13,58 +13,64 @@ from jeevanfit.models import (
     LifestyleInput,
     BodyTypeClassification,
     HabitType,
+    ValidationError,
+    ValidationResult,
 )
 
 
+FROZEN_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+# Valid field values for each model, validated with model_validate;
+# rejection tests override one field
+NUTRI_DICT = {
+    "calories": 100,
+    "protein": 5,
+    "carbohydrates": 15,
+    "fat": 3,
+    "sodium": 200,
+    "sugar": 2,
+    "fiber": 1,
+    "preservatives": [],
+    "processing_level": 1,
+}
+FOOD_DICT = {
+    "name": "Apple",
+    "serving_size": 1,
+    "unit": "medium",
+    "nutritional_info": NUTRI_DICT,
+}
+SLEEP_DICT = {
+    "duration": 8.0,
+    "quality": 9,
+    "bedtime": time(22, 0),
+    "wake_time": time(6, 0),
+    "interruptions": 0,
+    "timestamp": FROZEN_TS,
+}
+HABIT_DICT = {
+    "type": HabitType.EXERCISE,
+    "intensity": 7,
+    "duration": 1.0,
+}
+LIFESTYLE_DICT = {
+    "food_items": [FOOD_DICT],
+    "water_intake": 2500,
+    "sleep_data": None,
+    "daily_habits": [],
+    "timestamp": FROZEN_TS,
+    "user_id": "user-789",
+}
+
+
 class TestNutritionalInfo:
     """Tests for NutritionalInfo model."""
 
     def test_valid_nutritional_info(self):
         """Test creating valid nutritional info."""
-        info = NutritionalInfo(
-            calories=100,
-            protein=5,
-            carbohydrates=15,
-            fat=3,
-            sodium=200,
-            sugar=2,
-            fiber=1,
-            preservatives=[],
-            processing_level=1
-        )
+        info = NutritionalInfo.model_validate(NUTRI_DICT)
         assert info.calories == 100
         assert info.processing_level == 1
 
-    def test_negative_values_rejected(self):
-        """Test that negative nutritional values are rejected."""
-        with pytest.raises(PydanticValidationError):
-            NutritionalInfo(
-                calories=-100,
-                protein=5,
-                carbohydrates=15,
-                fat=3,
-                sodium=200,
-                sugar=2,
-                fiber=1,
-                preservatives=[],
-                processing_level=1
-            )
-
-    def test_invalid_processing_level(self):
-        """Test that processing level outside 1-5 range is rejected."""
-        with pytest.raises(PydanticValidationError):
-            NutritionalInfo(
-                calories=100,
-                protein=5,
-                carbohydrates=15,
-                fat=3,
-                sodium=200,
-                sugar=2,
-                fiber=1,
-                preservatives=[],
-                processing_level=6
-            )
-
 
 class TestFoodItem:
     """Tests for FoodItem model."""
@@ -80,67 +86,16 @@ class TestFoodItem:
         assert food.name == "Apple"
         assert food.serving_size == 1
 
-    def test_empty_name_rejected(self, sample_nutritional_info):
-        """Test that empty food name is rejected."""
-        with pytest.raises(PydanticValidationError):
-            FoodItem(
-                name="",
-                serving_size=1,
-                unit="medium",
-                nutritional_info=sample_nutritional_info
-            )
-
-    def test_zero_serving_size_rejected(self, sample_nutritional_info):
-        """Test that zero serving size is rejected."""
-        with pytest.raises(PydanticValidationError):
-            FoodItem(
-                name="Apple",
-                serving_size=0,
-                unit="medium",
-                nutritional_info=sample_nutritional_info
-            )
-
 
 class TestSleepData:
     """Tests for SleepData model."""
 
     def test_valid_sleep_data(self):
         """Test creating valid sleep data."""
-        sleep = SleepData(
-            duration=8.0,
-            quality=9,
-            bedtime=time(22, 0),
-            wake_time=time(6, 0),
-            interruptions=0,
-            timestamp=datetime.now()
-        )
+        sleep = SleepData.model_validate(SLEEP_DICT)
         assert sleep.duration == 8.0
         assert sleep.quality == 9
 
-    def test_invalid_duration(self):
-        """Test that duration outside 0-24 range is rejected."""
-        with pytest.raises(PydanticValidationError):
-            SleepData(
-                duration=25.0,
-                quality=9,
-                bedtime=time(22, 0),
-                wake_time=time(6, 0),
-                interruptions=0,
-                timestamp=datetime.now()
-            )
-
-    def test_invalid_quality(self):
-        """Test that quality outside 1-10 range is rejected."""
-        with pytest.raises(PydanticValidationError):
-            SleepData(
-                duration=8.0,
-                quality=11,
-                bedtime=time(22, 0),
-                wake_time=time(6, 0),
-                interruptions=0,
-                timestamp=datetime.now()
-            )
-
 
 class TestHabit:
     """Tests for Habit model."""
@@ -157,15 +112,6 @@ class TestHabit:
         assert habit.type == HabitType.EXERCISE
         assert habit.intensity == 7
 
-    def test_invalid_intensity(self):
-        """Test that intensity outside 1-10 range is rejected."""
-        with pytest.raises(PydanticValidationError):
-            Habit(
-                type=HabitType.EXERCISE,
-                intensity=11,
-                duration=1.0
-            )
-
 
 class TestBodyType:
     """Tests for BodyType model."""
@@ -191,24 +137,12 @@ class TestLifestyleInput:
             water_intake=2500,
             sleep_data=sample_sleep_data,
             daily_habits=[sample_habit],
-            timestamp=datetime.now(),
+            timestamp=FROZEN_TS,
             user_id="user-789"
         )
         assert len(lifestyle.food_items) == 1
         assert lifestyle.water_intake == 2500
 
-    def test_excessive_water_intake_rejected(self, sample_food_item):
-        """Test that excessive water intake is rejected."""
-        with pytest.raises(PydanticValidationError):
-            LifestyleInput(
-                food_items=[sample_food_item],
-                water_intake=15000,  # More than 10L
-                sleep_data=None,
-                daily_habits=[],
-                timestamp=datetime.now(),
-                user_id="user-789"
-            )
-
     def test_empty_lifestyle_input(self):
         """Test creating lifestyle input with minimal data."""
         lifestyle = LifestyleInput(
@@ -216,8 +150,86 @@ class TestLifestyleInput:
             water_intake=0,
             sleep_data=None,
             daily_habits=[],
-            timestamp=datetime.now(),
+            timestamp=FROZEN_TS,
             user_id="user-minimal"
         )
         assert len(lifestyle.food_items) == 0
         assert lifestyle.water_intake == 0
+
+
+class TestRejectedValues:
+    """Tests that each model rejects a single invalid field."""
+
+    @pytest.mark.parametrize("model,base,field,value", [
+        (NutritionalInfo, NUTRI_DICT, "calories", -100),  # Negative nutritional values
+        (NutritionalInfo, NUTRI_DICT, "processing_level", 6),  # Outside the 1-5 range
+        (FoodItem, FOOD_DICT, "name", ""),
+        (FoodItem, FOOD_DICT, "serving_size", 0),
+        (SleepData, SLEEP_DICT, "duration", 25.0),  # Outside the 0-24 range
+        (SleepData, SLEEP_DICT, "quality", 11),  # Outside the 1-10 range
+        (Habit, HABIT_DICT, "intensity", 11),  # Outside the 1-10 range
+        (Habit, HABIT_DICT, "intensity", 0),
+        (LifestyleInput, LIFESTYLE_DICT, "water_intake", 15000),  # More than 10L
+    ], ids=[
+        "nutrition-negative-calories", "nutrition-processing-level",
+        "food-empty-name", "food-zero-serving-size",
+        "sleep-duration", "sleep-quality",
+        "habit-intensity-high", "habit-intensity-low",
+        "lifestyle-excessive-water",
+    ])
+    def test_invalid_value_rejected(self, model, base, field, value):
+        """Test that overriding one field of a valid dict with a bad value is rejected."""
+        with pytest.raises(PydanticValidationError):
+            model.model_validate({**base, field: value})
+
+
+class TestValidationResult:
+    """Tests for ValidationResult model."""
+
+    def test_errors_by_field_groups_errors(self):
+        """Test that errors are indexed by their field."""
+        errors = [
+            ValidationError(field="user_id", message="Required field 'user_id' is missing",
+                            suggested_fix="Please provide a value for 'user_id'"),
+            ValidationError(field="water_intake", message="Water intake seems unusually high",
+                            suggested_fix="Please verify the water intake value"),
+            ValidationError(field="user_id", message="User id must be a string",
+                            suggested_fix="Please provide a valid user_id"),
+        ]
+        result = ValidationResult(is_valid=False, errors=errors)
+
+        assert [e.message for e in result.errors_by_field["user_id"]] == [
+            "Required field 'user_id' is missing",
+            "User id must be a string",
+        ]
+        assert len(result.errors_by_field["water_intake"]) == 1
+        assert "sleep_data" not in result.errors_by_field
+        assert "errors_by_field" not in result.model_dump()
+
+    def test_errors_by_field_follows_copied_errors(self):
+        """Test that a copy with replaced errors is grouped by its own errors."""
+        original = ValidationResult(is_valid=False, errors=[
+            ValidationError(field="user_id", message="Required field 'user_id' is missing",
+                            suggested_fix="Please provide a value for 'user_id'"),
+        ])
+        assert list(original.errors_by_field) == ["user_id"]
+
+        copy = original.model_copy(update={"errors": [
+            ValidationError(field="water_intake", message="Water intake seems unusually high",
+                            suggested_fix="Please verify the water intake value"),
+        ]})
+
+        assert list(copy.errors_by_field) == ["water_intake"]
+        assert list(original.errors_by_field) == ["user_id"]
+
+    def test_validation_models_are_frozen(self):
+        """Test that validation errors and results cannot be reassigned."""
+        error = ValidationError(field="user_id", message="Required field 'user_id' is missing",
+                                suggested_fix="Please provide a value for 'user_id'")
+        result = ValidationResult(is_valid=False, errors=[error])
+
+        with pytest.raises(PydanticValidationError):
+            error.field = "water_intake"
+        with pytest.raises(PydanticValidationError):
+            result.is_valid = True
+        assert hash(error) == hash(error.model_copy())
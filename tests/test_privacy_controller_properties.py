@@ -4,53 +4,82 @@ Feature: fitbuddy-lifestyle-assistant
 Tests Properties 28 and 29 from the design document.
 """
 
+import base64
+import json
+import operator
+import os
+import uuid
+
 import pytest
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st, HealthCheck, Phase
 from jeevanfit.privacy import PrivacyController, EncryptedData
 
 
-# Strategy for generating various data types to encrypt
-@st.composite
-def data_to_encrypt(draw):
-    """Generate various types of data that might need encryption."""
-    data_type = draw(st.sampled_from([
-        'string', 'number', 'list', 'dict', 'nested', 'mixed'
-    ]))
-    
-    if data_type == 'string':
-        return draw(st.text(min_size=0, max_size=1000))
-    elif data_type == 'number':
-        return draw(st.one_of(st.integers(), st.floats(allow_nan=False, allow_infinity=False)))
-    elif data_type == 'list':
-        return draw(st.lists(st.one_of(st.text(), st.integers()), max_size=20))
-    elif data_type == 'dict':
-        return draw(st.dictionaries(
-            st.text(min_size=1, max_size=50),
-            st.one_of(st.text(), st.integers(), st.booleans()),
-            max_size=10
-        ))
-    elif data_type == 'nested':
-        return {
-            'user_id': draw(st.text(min_size=1, max_size=50)),
-            'data': draw(st.lists(st.dictionaries(
-                st.text(min_size=1, max_size=20),
-                st.one_of(st.text(), st.integers()),
-                max_size=5
-            ), max_size=5))
-        }
-    else:  # mixed
-        return {
-            'string': draw(st.text(max_size=100)),
-            'number': draw(st.integers()),
-            'list': draw(st.lists(st.integers(), max_size=10)),
-            'bool': draw(st.booleans())
-        }
+@pytest.fixture(scope="module")
+def controller():
+    """Default-key controller shared by every example in this module."""
+    return PrivacyController()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_backend(controller):
+    """Run one encrypt/decrypt/export cycle before the first property example.
+
+    The first AES operation pays for the cipher backend's one-time setup;
+    doing it here keeps that cost out of the first example of each test.
+    """
+    controller.decryptData(controller.encryptData("warm"))
+    controller.exportUserData("warmup")
+
+
+# Pairs of distinct random keys generated once; examples pick a pair by index
+# so key isolation is checked across several keys without per-example syscalls
+_KEY_POOL = [(os.urandom(32), os.urandom(32)) for _ in range(16)]
+
+
+@pytest.fixture(scope="module")
+def controller_pairs():
+    """Controllers for each key pair in _KEY_POOL, built once per module."""
+    return [
+        (PrivacyController(encryption_key=key1), PrivacyController(encryption_key=key2))
+        for key1, key2 in _KEY_POOL
+    ]
+
+
+# Scalar leaves for data_to_encrypt
+_SCALARS = st.one_of(
+    st.text(max_size=200),
+    st.integers(),
+    st.floats(allow_nan=False, allow_infinity=False),
+    st.booleans()
+)
+
+# Scalars and lists or dicts nesting them
+_TREES = st.recursive(
+    _SCALARS,
+    lambda children: st.one_of(
+        st.lists(children, max_size=5),
+        st.dictionaries(st.text(min_size=1, max_size=20), children, max_size=5)
+    ),
+    max_leaves=15
+)
+
+# A multi-block (several KB) string built by repetition so it is cheap to
+# generate. It is a rare top-level alternative rather than a leaf, so trees
+# never hold several of them and most payloads stay small
+_BLOB = st.builds(operator.mul, st.text(min_size=1, max_size=16), st.integers(min_value=256, max_value=1024))
+
+# Strategy for generating various data types to encrypt: a blob one draw in
+# seven, as in the original per-type sampling. one_of cannot weight this,
+# since it merges repeated copies of the same strategy
+data_to_encrypt = st.sampled_from((_TREES,) * 6 + (_BLOB,)).flatmap(lambda strategy: strategy)
 
 
 # Property 28: Data encryption at rest
 # Feature: fitbuddy-lifestyle-assistant, Property 28: Data encryption at rest
-@given(data=data_to_encrypt())
-def test_property_28_data_encryption_at_rest(data):
+@given(data=data_to_encrypt)
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+def test_property_28_data_encryption_at_rest(controller, data):
     """**Validates: Requirements 9.1**
     
     Property 28: Data encryption at rest
@@ -63,10 +92,8 @@ def test_property_28_data_encryption_at_rest(data):
     3. Encrypted data uses the correct algorithm
     4. Each encryption produces unique ciphertext (due to random IV)
     """
-    controller = PrivacyController()
-    
-    # Encrypt the data
-    encrypted = controller.encryptData(data)
+    # Encrypt the data twice in one batch, serializing it only once
+    encrypted, encrypted2 = controller.encryptDataBatch([data, data])
     
     # Verify it's an EncryptedData object
     assert isinstance(encrypted, EncryptedData)
@@ -81,28 +108,39 @@ def test_property_28_data_encryption_at_rest(data):
     assert len(encrypted.iv) > 0
     
     # Verify encrypted data is different from original (when serialized)
-    # The ciphertext should not contain the plaintext
-    import json
-    plaintext_str = json.dumps(data, default=str)
-    assert plaintext_str not in encrypted.ciphertext
+    # The ciphertext should not contain the plaintext; serialize exactly as
+    # encryptData does so the check looks for the bytes actually encrypted.
+    # Plaintexts shorter than one AES block can turn up in random ciphertext
+    # bytes by chance, so only block-sized or longer ones are searched for.
+    # A single-block ciphertext always holds a shorter (padded) plaintext, so
+    # the serialization is skipped for those.
+    ciphertext = base64.b64decode(encrypted.ciphertext)
+    if len(ciphertext) > 16:
+        plaintext = json.dumps(data, default=str).encode('utf-8')
+        if len(plaintext) >= 16:
+            assert ciphertext.find(plaintext) == -1
     
     # Verify that encrypting the same data twice produces different ciphertexts
-    # (due to random IV)
-    encrypted2 = controller.encryptData(data)
-    assert encrypted.ciphertext != encrypted2.ciphertext or encrypted.iv != encrypted2.iv
+    # (due to random IV); the fixed-size IVs are compared first so large
+    # ciphertexts are only compared in the (astronomically rare) IV collision
+    assert encrypted.iv != encrypted2.iv or encrypted.ciphertext != encrypted2.ciphertext
 
 
 # Property 28 (additional): Encryption round-trip preserves data
-@given(data=data_to_encrypt())
-def test_property_28_encryption_round_trip(data):
+@given(data=data_to_encrypt)
+@settings(
+    max_examples=50,
+    deadline=None,
+    phases=[Phase.explicit, Phase.generate],
+    suppress_health_check=[HealthCheck.too_slow]
+)
+def test_property_28_encryption_round_trip(controller, data):
     """**Validates: Requirements 9.1**
     
     Property 28 (round-trip): Encryption and decryption preserve data
     For any data that is encrypted and then decrypted, the result should be
     identical to the original data.
     """
-    controller = PrivacyController()
-    
     # Encrypt then decrypt
     encrypted = controller.encryptData(data)
     decrypted = controller.decryptData(encrypted)
@@ -112,20 +150,15 @@ def test_property_28_encryption_round_trip(data):
 
 
 # Property 28 (additional): Different keys produce different ciphertexts
-@given(data=data_to_encrypt())
-def test_property_28_different_keys_different_ciphertext(data):
+@given(data=data_to_encrypt, idx=st.integers(min_value=0, max_value=len(_KEY_POOL) - 1))
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+def test_property_28_different_keys_different_ciphertext(controller_pairs, data, idx):
     """**Validates: Requirements 9.1**
     
     Property 28 (key isolation): Different encryption keys produce different ciphertexts
     For any data encrypted with different keys, the ciphertexts should be different.
     """
-    import os
-    
-    key1 = os.urandom(32)
-    key2 = os.urandom(32)
-    
-    controller1 = PrivacyController(encryption_key=key1)
-    controller2 = PrivacyController(encryption_key=key2)
+    controller1, controller2 = controller_pairs[idx]
     
     encrypted1 = controller1.encryptData(data)
     encrypted2 = controller2.encryptData(data)
@@ -136,81 +169,69 @@ def test_property_28_different_keys_different_ciphertext(data):
 
 
 # Property 28 (additional): Cannot decrypt with wrong key
-@given(data=data_to_encrypt())
-def test_property_28_wrong_key_fails_decryption(data):
+@given(data=data_to_encrypt, idx=st.integers(min_value=0, max_value=len(_KEY_POOL) - 1))
+@settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+def test_property_28_wrong_key_fails_decryption(controller_pairs, data, idx):
     """**Validates: Requirements 9.1**
     
     Property 28 (key security): Data encrypted with one key cannot be decrypted with another
     For any data encrypted with one key, attempting to decrypt with a different key
     should fail or produce garbage data.
     """
-    import os
-    
-    key1 = os.urandom(32)
-    key2 = os.urandom(32)
-    
-    controller1 = PrivacyController(encryption_key=key1)
-    controller2 = PrivacyController(encryption_key=key2)
+    controller1, controller2 = controller_pairs[idx]
     
     encrypted = controller1.encryptData(data)
     
-    # Attempting to decrypt with wrong key should fail
-    try:
-        decrypted = controller2.decryptData(encrypted)
-        # If it doesn't raise an exception, the decrypted data should be different
-        assert decrypted != data
-    except Exception:
-        # Expected: decryption should fail with wrong key
-        pass
+    # Attempting to decrypt with wrong key should fail: the garbled plaintext
+    # fails unpadding, UTF-8 decoding or JSON parsing, all ValueErrors
+    with pytest.raises(ValueError):
+        controller2.decryptData(encrypted)
+
+
+# Inner strategies for user_data_with_components, built once at import
+_USER_ID = st.text(min_size=1, max_size=50)
+_LIFESTYLE_ENTRIES = st.lists(
+    st.dictionaries(
+        st.sampled_from(['entry_id', 'timestamp', 'food_items', 'water_intake', 'sleep_data']),
+        st.one_of(st.text(), st.integers(), st.floats(allow_nan=False, allow_infinity=False)),
+        min_size=1
+    ),
+    min_size=1,
+    max_size=10
+)
+_ANALYSIS_HISTORY = st.lists(
+    st.dictionaries(
+        st.sampled_from(['record_id', 'timestamp', 'analysis_type', 'confidence']),
+        st.one_of(st.text(), st.integers(), st.floats(min_value=0, max_value=1, allow_nan=False)),
+        min_size=1
+    ),
+    min_size=0,
+    max_size=5
+)
+_PROFILE = st.dictionaries(
+    st.sampled_from(['body_type', 'preferences', 'created_at']),
+    st.one_of(st.text(), st.dictionaries(st.text(min_size=1), st.text(), max_size=3)),
+    min_size=1
+)
 
 
 # Strategy for generating user data with multiple components
 @st.composite
 def user_data_with_components(draw):
     """Generate realistic user data with lifestyle entries, analysis history, and profile."""
-    user_id = draw(st.text(min_size=1, max_size=50))
-    
-    # Generate lifestyle entries
-    lifestyle_entries = draw(st.lists(
-        st.dictionaries(
-            st.sampled_from(['entry_id', 'timestamp', 'food_items', 'water_intake', 'sleep_data']),
-            st.one_of(st.text(), st.integers(), st.floats(allow_nan=False, allow_infinity=False)),
-            min_size=1
-        ),
-        min_size=1,
-        max_size=10
-    ))
-    
-    # Generate analysis history
-    analysis_history = draw(st.lists(
-        st.dictionaries(
-            st.sampled_from(['record_id', 'timestamp', 'analysis_type', 'confidence']),
-            st.one_of(st.text(), st.integers(), st.floats(min_value=0, max_value=1, allow_nan=False)),
-            min_size=1
-        ),
-        min_size=0,
-        max_size=5
-    ))
-    
-    # Generate profile information
-    profile = draw(st.dictionaries(
-        st.sampled_from(['body_type', 'preferences', 'created_at']),
-        st.one_of(st.text(), st.dictionaries(st.text(min_size=1), st.text(), max_size=3)),
-        min_size=1
-    ))
-    
     return {
-        'user_id': user_id,
-        'lifestyle_entries': lifestyle_entries,
-        'analysis_history': analysis_history,
-        'profile': profile
+        'user_id': draw(_USER_ID),
+        'lifestyle_entries': draw(_LIFESTYLE_ENTRIES),
+        'analysis_history': draw(_ANALYSIS_HISTORY),
+        'profile': draw(_PROFILE)
     }
 
 
 # Property 29: Data export completeness
 # Feature: fitbuddy-lifestyle-assistant, Property 29: Data export completeness
 @given(user_data=user_data_with_components())
-def test_property_29_data_export_completeness(user_data):
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+def test_property_29_data_export_completeness(controller, user_data):
     """**Validates: Requirements 9.4**
     
     Property 29: Data export completeness
@@ -224,8 +245,8 @@ def test_property_29_data_export_completeness(user_data):
     3. Export includes user_id and export_date
     4. All original data is present in the export
     """
-    controller = PrivacyController()
-    user_id = user_data['user_id']
+    # Namespace the id so examples sharing the controller never collide
+    user_id = f"{uuid.uuid4().hex}_{user_data['user_id']}"
     
     # Store user data
     controller._store_user_data(user_id, user_data)
@@ -233,17 +254,25 @@ def test_property_29_data_export_completeness(user_data):
     # Export the data
     export = controller.exportUserData(user_id)
     
-    # Verify export structure
+    _check_export_structure(export, user_id)
+    _check_export_complete(export.data, user_data)
+    _check_export_json(export, user_id)
+    
+    controller.deleteUserData(user_id)
+
+
+def _check_export_structure(export, user_id):
+    """Export carries the user id, JSON format and an export date."""
     assert export.user_id == user_id
     assert export.format == "JSON"
     assert export.export_date is not None
-    
-    # Verify all data is present in export
-    exported_data = export.data
-    
+
+
+def _check_export_complete(exported_data, user_data):
+    """All stored data components are present in the export."""
     # Check that all top-level keys from original data are in export
-    for key in user_data.keys():
-        assert key in exported_data, f"Key '{key}' missing from export"
+    missing = user_data.keys() - exported_data.keys()
+    assert not missing, f"Keys missing from export: {missing}"
     
     # Verify lifestyle entries are complete
     if 'lifestyle_entries' in user_data:
@@ -258,37 +287,35 @@ def test_property_29_data_export_completeness(user_data):
     # Verify profile is complete
     if 'profile' in user_data:
         assert 'profile' in exported_data
-    
-    # Verify export can be converted to JSON (valid JSON format)
-    import json
+
+
+def _check_export_json(export, user_id):
+    """The export converts to valid JSON."""
     export_dict = export.to_dict()
-    json_str = json.dumps(export_dict, default=str)
-    assert json_str is not None
+    try:
+        json.dumps(export_dict, default=str, separators=(',', ':'))
+    except (TypeError, ValueError) as e:
+        pytest.fail(f"Export is not JSON-serializable: {e}")
     
-    # Verify we can parse it back
-    parsed = json.loads(json_str)
-    assert parsed['user_id'] == user_id
-    assert parsed['format'] == "JSON"
+    assert export_dict['user_id'] == user_id
+    assert export_dict['format'] == "JSON"
 
 
 # Property 29 (additional): Export for non-existent user returns empty data
 @given(user_id=st.text(min_size=1, max_size=50))
-def test_property_29_export_nonexistent_user(user_id):
+@settings(deadline=None, suppress_health_check=[HealthCheck.too_slow])
+def test_property_29_export_nonexistent_user(controller, user_id):
     """**Validates: Requirements 9.4**
     
     Property 29 (edge case): Export for non-existent user
     For any user ID that has no stored data, the export should return an empty
     data structure but still be valid.
     """
-    controller = PrivacyController()
-    
     # Export data for user that doesn't exist
     export = controller.exportUserData(user_id)
     
     # Verify export structure is valid
-    assert export.user_id == user_id
-    assert export.format == "JSON"
-    assert export.export_date is not None
+    _check_export_structure(export, user_id)
     
     # Data should be empty dict
     assert export.data == {}
@@ -296,15 +323,21 @@ def test_property_29_export_nonexistent_user(user_id):
 
 # Property 29 (additional): Multiple exports produce consistent data
 @given(user_data=user_data_with_components())
-def test_property_29_export_consistency(user_data):
+@settings(
+    max_examples=50,
+    deadline=None,
+    phases=[Phase.explicit, Phase.generate],
+    suppress_health_check=[HealthCheck.too_slow]
+)
+def test_property_29_export_consistency(controller, user_data):
     """**Validates: Requirements 9.4**
     
     Property 29 (consistency): Multiple exports of same user produce same data
     For any user, exporting their data multiple times should produce the same
     data content (though export_date will differ).
     """
-    controller = PrivacyController()
-    user_id = user_data['user_id']
+    # Namespace the id so examples sharing the controller never collide
+    user_id = f"{uuid.uuid4().hex}_{user_data['user_id']}"
     
     # Store user data
     controller._store_user_data(user_id, user_data)
@@ -317,3 +350,5 @@ def test_property_29_export_consistency(user_data):
     assert export1.data == export2.data
     assert export1.user_id == export2.user_id
     assert export1.format == export2.format
+    
+    controller.deleteUserData(user_id)
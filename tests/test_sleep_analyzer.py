@@ -20,15 +20,100 @@ from jeevanfit.models import (
 )
 
 
+# Fixed timestamp for SleepData records; the analyzer never reads the sleep
+# timestamp, so tests need no wall-clock time
+_FROZEN_NOW = datetime(2024, 1, 15, 22, 0)
+
+# Sort rank of each recommendation priority, highest priority first
+_PRIORITY_RANK = {
+    RecommendationPriority.HIGH: 0,
+    RecommendationPriority.MEDIUM: 1,
+    RecommendationPriority.LOW: 2
+}
+
+# Habit and food templates built once; tests take model_copy(update=...)
+# copies with the fields they care about, so the templates are never mutated
+_CAFFEINE_HABIT = Habit(type=HabitType.CAFFEINE, intensity=7)
+_STRESS_HABIT = Habit(type=HabitType.STRESS, intensity=9)
+_SCREEN_HABIT = Habit(type=HabitType.SCREEN_TIME, intensity=5)
+_LATE_DINNER = FoodItem(
+    name="Late dinner",
+    serving_size=300,
+    unit="g",
+    nutritional_info=NutritionalInfo(
+        calories=500,
+        protein=25,
+        carbohydrates=50,
+        fat=20,
+        sodium=600,
+        sugar=5,
+        fiber=4,
+        preservatives=[],
+        processing_level=2
+    )
+)
+
+# Prototype for the optimal_lifestyle fixture; only copies are handed to tests
+_OPTIMAL_LIFESTYLE = LifestyleInput(
+    food_items=[],
+    water_intake=2500,
+    sleep_data=None,  # Set by each test
+    daily_habits=[],
+    user_id="test-user",
+    timestamp=datetime(2024, 1, 15, 18, 0)  # 6 PM
+)
+
+
+# Mutators applied to optimal_lifestyle by test_disruptor_detection; each
+# introduces one habit that may or may not count as a sleep disruptor
+def _add_late_caffeine(lifestyle):
+    """Coffee 3 hours before the 22:00 bedtime."""
+    lifestyle.daily_habits.append(_CAFFEINE_HABIT.model_copy(update=dict(
+        intensity=8, duration=0.5, timing=time(19, 0), notes="Late coffee"
+    )))
+
+
+def _add_early_caffeine(lifestyle):
+    """Coffee 12 hours before bedtime, well outside the cutoff."""
+    lifestyle.daily_habits.append(_CAFFEINE_HABIT.model_copy(update=dict(
+        duration=0.25, timing=time(10, 0), notes="Morning coffee"
+    )))
+
+
+def _add_late_dinner(lifestyle):
+    """A large meal logged 1.5 hours before bedtime."""
+    lifestyle.timestamp = datetime(2024, 1, 15, 20, 30)
+    lifestyle.food_items.append(_LATE_DINNER.model_copy())
+
+
+def _add_high_stress(lifestyle):
+    """A high stress day."""
+    lifestyle.daily_habits.append(_STRESS_HABIT.model_copy(update=dict(
+        intensity=8, duration=5.0, notes="High stress day"
+    )))
+
+
+def _add_late_screen_time(lifestyle):
+    """Phone use 1 hour before bedtime."""
+    lifestyle.daily_habits.append(_SCREEN_HABIT.model_copy(update=dict(
+        intensity=6, duration=2.0, timing=time(21, 0), notes="Phone before bed"
+    )))
+
+
+def _reduce_water_intake(lifestyle):
+    """Water intake below the dehydration threshold."""
+    lifestyle.water_intake = 1200
+
+
 class TestSleepAnalyzer:
     """Test suite for SleepAnalyzer class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def analyzer(self):
-        """Create a SleepAnalyzer instance."""
+        """Create a SleepAnalyzer instance shared by the module; it holds no state."""
         return SleepAnalyzer()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def good_sleep_data(self):
         """Create good quality sleep data."""
         return SleepData(
@@ -37,10 +122,10 @@ class TestSleepAnalyzer:
             bedtime=time(22, 0),
             wake_time=time(6, 0),
             interruptions=0,
-            timestamp=datetime.now()
+            timestamp=_FROZEN_NOW
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def poor_sleep_data(self):
         """Create poor quality sleep data."""
         return SleepData(
@@ -49,23 +134,36 @@ class TestSleepAnalyzer:
             bedtime=time(23, 30),
             wake_time=time(5, 0),
             interruptions=3,
-            timestamp=datetime.now()
+            timestamp=_FROZEN_NOW
+        )
+    
+    @pytest.fixture(scope="module")
+    def borderline_sleep(self):
+        """Create fair sleep data with a 22:00 bedtime for disruptor checks."""
+        return SleepData(
+            duration=7.0,
+            quality=6,
+            bedtime=time(22, 0),
+            wake_time=time(5, 0),
+            interruptions=1,
+            timestamp=_FROZEN_NOW
         )
     
     @pytest.fixture
     def optimal_lifestyle(self):
-        """Create lifestyle input with optimal conditions."""
-        return LifestyleInput(
-            food_items=[],
-            water_intake=2500,
-            sleep_data=None,  # Will be set in tests
-            daily_habits=[],
-            user_id="test-user",
-            timestamp=datetime(2024, 1, 15, 18, 0)  # 6 PM
-        )
+        """Create lifestyle input with optimal conditions.
+        
+        Tests mutate the result, so each gets a copy of the prototype with
+        fresh food and habit lists.
+        """
+        return _OPTIMAL_LIFESTYLE.model_copy(update=dict(food_items=[], daily_habits=[]))
     
     def test_analyze_sleep_with_good_conditions(self, analyzer, good_sleep_data, optimal_lifestyle):
-        """Test sleep analysis with good sleep and optimal conditions."""
+        """Test sleep analysis with good sleep and optimal conditions.
+        
+        Also checks that the explanation includes key sleep metrics, so the
+        analysis is only computed once for these inputs.
+        """
         optimal_lifestyle.sleep_data = good_sleep_data
         
         analysis = analyzer.analyze_sleep(good_sleep_data, optimal_lifestyle)
@@ -75,6 +173,10 @@ class TestSleepAnalyzer:
         assert isinstance(analysis.recommendations, list)
         assert analysis.explanation
         assert len(analysis.explanation) > 0
+        
+        # Explanation should mention duration and quality
+        assert str(good_sleep_data.duration) in analysis.explanation or "hour" in analysis.explanation.lower()
+        assert str(good_sleep_data.quality) in analysis.explanation
     
     def test_analyze_sleep_with_poor_conditions(self, analyzer, poor_sleep_data, optimal_lifestyle):
         """Test sleep analysis with poor sleep quality."""
@@ -88,45 +190,31 @@ class TestSleepAnalyzer:
     def test_analyze_sleep_with_late_caffeine(self, analyzer, good_sleep_data, optimal_lifestyle):
         """Test sleep analysis detects late caffeine consumption."""
         # Add caffeine 4 hours before bedtime (22:00 - 4h = 18:00)
-        caffeine_habit = Habit(
-            type=HabitType.CAFFEINE,
-            intensity=7,
-            duration=0.25,
-            timing=time(18, 0),
-            notes="Evening coffee"
-        )
+        caffeine_habit = _CAFFEINE_HABIT.model_copy(update=dict(
+            duration=0.25, timing=time(18, 0), notes="Evening coffee"
+        ))
         optimal_lifestyle.daily_habits.append(caffeine_habit)
         optimal_lifestyle.sleep_data = good_sleep_data
         
         analysis = analyzer.analyze_sleep(good_sleep_data, optimal_lifestyle)
         
         # Should identify caffeine as a negative correlation
-        caffeine_correlations = [
-            c for c in analysis.correlations
-            if "caffeine" in c.habit.lower()
-        ]
+        caffeine_correlations = analysis.correlations_by_factor.get(SleepDisruptorType.CAFFEINE, [])
         assert len(caffeine_correlations) > 0
         assert caffeine_correlations[0].impact == ImpactType.NEGATIVE
     
     def test_analyze_sleep_with_high_stress(self, analyzer, poor_sleep_data, optimal_lifestyle):
         """Test sleep analysis detects high stress impact."""
-        stress_habit = Habit(
-            type=HabitType.STRESS,
-            intensity=9,
-            duration=6.0,
-            timing=time(14, 0),
-            notes="Work stress"
-        )
+        stress_habit = _STRESS_HABIT.model_copy(update=dict(
+            duration=6.0, timing=time(14, 0), notes="Work stress"
+        ))
         optimal_lifestyle.daily_habits.append(stress_habit)
         optimal_lifestyle.sleep_data = poor_sleep_data
         
         analysis = analyzer.analyze_sleep(poor_sleep_data, optimal_lifestyle)
         
         # Should identify stress as a negative correlation
-        stress_correlations = [
-            c for c in analysis.correlations
-            if "stress" in c.habit.lower()
-        ]
+        stress_correlations = analysis.correlations_by_factor.get(SleepDisruptorType.STRESS, [])
         assert len(stress_correlations) > 0
         assert stress_correlations[0].impact == ImpactType.NEGATIVE
     
@@ -138,152 +226,47 @@ class TestSleepAnalyzer:
         analysis = analyzer.analyze_sleep(poor_sleep_data, optimal_lifestyle)
         
         # Should identify hydration as a factor
-        hydration_correlations = [
-            c for c in analysis.correlations
-            if "water" in c.habit.lower() or "hydration" in c.habit.lower()
-        ]
+        hydration_correlations = analysis.correlations_by_factor.get(SleepDisruptorType.DEHYDRATION, [])
         assert len(hydration_correlations) > 0
     
-    def test_identify_sleep_disruptors_caffeine(self, analyzer, optimal_lifestyle):
-        """Test identification of caffeine as a sleep disruptor."""
-        optimal_lifestyle.sleep_data = SleepData(
-            duration=7.0,
-            quality=6,
-            bedtime=time(22, 0),
-            wake_time=time(5, 0),
-            interruptions=1,
-            timestamp=datetime.now()
-        )
-        
-        # Add late caffeine
-        caffeine_habit = Habit(
-            type=HabitType.CAFFEINE,
-            intensity=8,
-            duration=0.5,
-            timing=time(19, 0),  # 3 hours before bed
-            notes="Late coffee"
-        )
-        optimal_lifestyle.daily_habits.append(caffeine_habit)
-        
-        disruptors = analyzer.identify_sleep_disruptors(optimal_lifestyle)
-        
-        # Should identify caffeine disruptor
-        caffeine_disruptors = [d for d in disruptors if d.type == SleepDisruptorType.CAFFEINE]
-        assert len(caffeine_disruptors) > 0
-        assert caffeine_disruptors[0].severity > 0
-        assert caffeine_disruptors[0].recommendation
-    
-    def test_identify_sleep_disruptors_late_eating(self, analyzer, optimal_lifestyle):
-        """Test identification of late eating as a sleep disruptor."""
-        optimal_lifestyle.sleep_data = SleepData(
-            duration=7.0,
-            quality=6,
-            bedtime=time(22, 0),
-            wake_time=time(5, 0),
-            interruptions=1,
-            timestamp=datetime.now()
-        )
-        
-        # Set timestamp to indicate eating close to bedtime
-        optimal_lifestyle.timestamp = datetime(2024, 1, 15, 20, 30)  # 1.5 hours before bed
-        
-        # Add food items
-        food = FoodItem(
-            name="Late dinner",
-            serving_size=300,
-            unit="g",
-            nutritional_info=NutritionalInfo(
-                calories=500,
-                protein=25,
-                carbohydrates=50,
-                fat=20,
-                sodium=600,
-                sugar=5,
-                fiber=4,
-                preservatives=[],
-                processing_level=2
-            )
-        )
-        optimal_lifestyle.food_items.append(food)
-        
-        disruptors = analyzer.identify_sleep_disruptors(optimal_lifestyle)
-        
-        # Should identify late eating disruptor
-        eating_disruptors = [d for d in disruptors if d.type == SleepDisruptorType.LATE_EATING]
-        assert len(eating_disruptors) > 0
-    
-    def test_identify_sleep_disruptors_stress(self, analyzer, optimal_lifestyle):
-        """Test identification of stress as a sleep disruptor."""
-        optimal_lifestyle.sleep_data = SleepData(
-            duration=6.5,
-            quality=5,
-            bedtime=time(23, 0),
-            wake_time=time(5, 30),
-            interruptions=2,
-            timestamp=datetime.now()
-        )
-        
-        # Add high stress
-        stress_habit = Habit(
-            type=HabitType.STRESS,
-            intensity=8,
-            duration=5.0,
-            notes="High stress day"
-        )
-        optimal_lifestyle.daily_habits.append(stress_habit)
-        
-        disruptors = analyzer.identify_sleep_disruptors(optimal_lifestyle)
-        
-        # Should identify stress disruptor
-        stress_disruptors = [d for d in disruptors if d.type == SleepDisruptorType.STRESS]
-        assert len(stress_disruptors) > 0
-        assert stress_disruptors[0].severity >= 6
-    
-    def test_identify_sleep_disruptors_screen_time(self, analyzer, optimal_lifestyle):
-        """Test identification of screen time as a sleep disruptor."""
-        optimal_lifestyle.sleep_data = SleepData(
-            duration=7.0,
-            quality=6,
-            bedtime=time(22, 0),
-            wake_time=time(5, 0),
-            interruptions=1,
-            timestamp=datetime.now()
-        )
-        
-        # Add late screen time
-        screen_habit = Habit(
-            type=HabitType.SCREEN_TIME,
-            intensity=6,
-            duration=2.0,
-            timing=time(21, 0),  # 1 hour before bed
-            notes="Phone before bed"
-        )
-        optimal_lifestyle.daily_habits.append(screen_habit)
+    def test_correlations_by_factor_follows_correlations(self, analyzer, poor_sleep_data, optimal_lifestyle):
+        """Test the factor grouping reflects reassigned and copied correlations."""
+        optimal_lifestyle.water_intake = 1000  # Low water intake
+        analysis = analyzer.analyze_sleep(poor_sleep_data, optimal_lifestyle)
+        assert SleepDisruptorType.DEHYDRATION in analysis.correlations_by_factor
         
-        disruptors = analyzer.identify_sleep_disruptors(optimal_lifestyle)
+        copy = analysis.model_copy(update={"correlations": []})
+        assert copy.correlations_by_factor == {}
+        assert SleepDisruptorType.DEHYDRATION in analysis.correlations_by_factor
         
-        # Should identify screen time disruptor
-        screen_disruptors = [d for d in disruptors if d.type == SleepDisruptorType.SCREEN_TIME]
-        assert len(screen_disruptors) > 0
+        analysis.correlations = []
+        assert analysis.correlations_by_factor == {}
     
-    def test_identify_sleep_disruptors_dehydration(self, analyzer, optimal_lifestyle):
-        """Test identification of dehydration as a sleep disruptor."""
-        optimal_lifestyle.sleep_data = SleepData(
-            duration=7.0,
-            quality=6,
-            bedtime=time(22, 0),
-            wake_time=time(5, 0),
-            interruptions=1,
-            timestamp=datetime.now()
-        )
-        
-        optimal_lifestyle.water_intake = 1200  # Low water
+    @pytest.mark.parametrize("mutator,expected_type,present,min_severity", [
+        (_add_late_caffeine, SleepDisruptorType.CAFFEINE, True, 1),
+        (_add_late_dinner, SleepDisruptorType.LATE_EATING, True, 1),
+        (_add_high_stress, SleepDisruptorType.STRESS, True, 6),
+        (_add_late_screen_time, SleepDisruptorType.SCREEN_TIME, True, 1),
+        (_reduce_water_intake, SleepDisruptorType.DEHYDRATION, True, 1),
+        (_add_early_caffeine, SleepDisruptorType.CAFFEINE, False, None),
+    ], ids=["caffeine", "late_eating", "stress", "screen_time", "dehydration", "early_caffeine"])
+    def test_disruptor_detection(
+        self, analyzer, borderline_sleep, optimal_lifestyle,
+        mutator, expected_type, present, min_severity
+    ):
+        """Test that each habit is flagged as a sleep disruptor only when it should be."""
+        optimal_lifestyle.sleep_data = borderline_sleep
+        mutator(optimal_lifestyle)
         
         disruptors = analyzer.identify_sleep_disruptors(optimal_lifestyle)
         
-        # Should identify dehydration disruptor
-        dehydration_disruptors = [d for d in disruptors if d.type == SleepDisruptorType.DEHYDRATION]
-        assert len(dehydration_disruptors) > 0
+        matching = [d for d in disruptors if d.type == expected_type]
+        if not present:
+            assert len(matching) == 0
+            return
+        assert len(matching) > 0
+        assert matching[0].severity >= min_severity
+        assert matching[0].recommendation
     
     def test_disruptors_sorted_by_severity(self, analyzer, optimal_lifestyle):
         """Test that disruptors are sorted by severity."""
@@ -293,14 +276,14 @@ class TestSleepAnalyzer:
             bedtime=time(22, 0),
             wake_time=time(4, 0),
             interruptions=2,
-            timestamp=datetime.now()
+            timestamp=_FROZEN_NOW
         )
         
         # Add multiple disruptors with different severities
         optimal_lifestyle.daily_habits.extend([
-            Habit(type=HabitType.CAFFEINE, intensity=7, timing=time(19, 0)),
-            Habit(type=HabitType.STRESS, intensity=9, duration=4.0),
-            Habit(type=HabitType.SCREEN_TIME, intensity=5, timing=time(21, 30))
+            _CAFFEINE_HABIT.model_copy(update=dict(timing=time(19, 0))),
+            _STRESS_HABIT.model_copy(update=dict(duration=4.0)),
+            _SCREEN_HABIT.model_copy(update=dict(timing=time(21, 30)))
         ])
         optimal_lifestyle.water_intake = 1300
         
@@ -317,7 +300,7 @@ class TestSleepAnalyzer:
         
         # Add some disruptors
         optimal_lifestyle.daily_habits.append(
-            Habit(type=HabitType.CAFFEINE, intensity=7, timing=time(18, 0))
+            _CAFFEINE_HABIT.model_copy(update=dict(timing=time(18, 0)))
         )
         optimal_lifestyle.water_intake = 1200
         
@@ -343,91 +326,40 @@ class TestSleepAnalyzer:
         
         # Add multiple disruptors
         optimal_lifestyle.daily_habits.extend([
-            Habit(type=HabitType.CAFFEINE, intensity=8, timing=time(19, 0)),
-            Habit(type=HabitType.STRESS, intensity=9, duration=5.0)
+            _CAFFEINE_HABIT.model_copy(update=dict(intensity=8, timing=time(19, 0))),
+            _STRESS_HABIT.model_copy(update=dict(duration=5.0))
         ])
         
         analysis = analyzer.analyze_sleep(poor_sleep_data, optimal_lifestyle)
         
         # High priority recommendations should come first
-        if len(analysis.recommendations) > 1:
-            priority_order = {
-                RecommendationPriority.HIGH: 0,
-                RecommendationPriority.MEDIUM: 1,
-                RecommendationPriority.LOW: 2
-            }
-            for i in range(len(analysis.recommendations) - 1):
-                current_priority = priority_order[analysis.recommendations[i].priority]
-                next_priority = priority_order[analysis.recommendations[i + 1].priority]
-                assert current_priority <= next_priority
+        ranks = [_PRIORITY_RANK[r.priority] for r in analysis.recommendations]
+        assert ranks == sorted(ranks)
     
-    def test_overall_quality_assessment_excellent(self, analyzer):
-        """Test overall quality assessment for excellent sleep."""
-        excellent_sleep = SleepData(
-            duration=8.0,
-            quality=9,
-            bedtime=time(22, 0),
-            wake_time=time(6, 0),
-            interruptions=0,
-            timestamp=datetime.now()
-        )
-        
-        quality = analyzer._assess_overall_quality(excellent_sleep)
-        assert quality == SleepQuality.EXCELLENT
-    
-    def test_overall_quality_assessment_poor(self, analyzer):
-        """Test overall quality assessment for poor sleep."""
-        poor_sleep = SleepData(
-            duration=5.0,
-            quality=3,
-            bedtime=time(1, 0),
-            wake_time=time(6, 0),
-            interruptions=4,
-            timestamp=datetime.now()
-        )
-        
-        quality = analyzer._assess_overall_quality(poor_sleep)
-        assert quality == SleepQuality.POOR
-    
-    def test_overall_quality_downgrade_for_short_duration(self, analyzer):
-        """Test that short sleep duration downgrades quality."""
-        short_sleep = SleepData(
-            duration=5.5,  # Short duration
-            quality=9,  # High quality rating
-            bedtime=time(1, 0),
-            wake_time=time(6, 30),
-            interruptions=0,
-            timestamp=datetime.now()
-        )
-        
-        quality = analyzer._assess_overall_quality(short_sleep)
-        # Should be downgraded from EXCELLENT
-        assert quality in [SleepQuality.GOOD, SleepQuality.FAIR]
-    
-    def test_overall_quality_downgrade_for_interruptions(self, analyzer):
-        """Test that frequent interruptions downgrade quality."""
-        interrupted_sleep = SleepData(
-            duration=8.0,
-            quality=9,
-            bedtime=time(22, 0),
-            wake_time=time(6, 0),
-            interruptions=4,  # Many interruptions
-            timestamp=datetime.now()
-        )
-        
-        quality = analyzer._assess_overall_quality(interrupted_sleep)
-        # Should be downgraded from EXCELLENT
-        assert quality in [SleepQuality.GOOD, SleepQuality.FAIR]
-    
-    def test_explanation_includes_sleep_metrics(self, analyzer, good_sleep_data, optimal_lifestyle):
-        """Test that explanation includes key sleep metrics."""
-        optimal_lifestyle.sleep_data = good_sleep_data
-        
-        analysis = analyzer.analyze_sleep(good_sleep_data, optimal_lifestyle)
-        
-        # Explanation should mention duration and quality
-        assert str(good_sleep_data.duration) in analysis.explanation or "hour" in analysis.explanation.lower()
-        assert str(good_sleep_data.quality) in analysis.explanation
+    @pytest.mark.parametrize("kwargs,allowed", [
+        (
+            dict(duration=8.0, quality=9, bedtime=time(22, 0), wake_time=time(6, 0), interruptions=0),
+            {SleepQuality.EXCELLENT}
+        ),
+        (
+            dict(duration=5.0, quality=3, bedtime=time(1, 0), wake_time=time(6, 0), interruptions=4),
+            {SleepQuality.POOR}
+        ),
+        # Short duration with a high quality rating is downgraded from EXCELLENT
+        (
+            dict(duration=5.5, quality=9, bedtime=time(1, 0), wake_time=time(6, 30), interruptions=0),
+            {SleepQuality.GOOD, SleepQuality.FAIR}
+        ),
+        # Frequent interruptions are downgraded from EXCELLENT
+        (
+            dict(duration=8.0, quality=9, bedtime=time(22, 0), wake_time=time(6, 0), interruptions=4),
+            {SleepQuality.GOOD, SleepQuality.FAIR}
+        ),
+    ], ids=["excellent", "poor", "short_duration_downgrade", "interruptions_downgrade"])
+    def test_overall_quality_assessment(self, analyzer, kwargs, allowed):
+        """Test overall quality assessment, including downgrades from EXCELLENT."""
+        quality = analyzer._assess_overall_quality(SleepData(**kwargs, timestamp=_FROZEN_NOW))
+        assert quality in allowed
     
     def test_explanation_mentions_interruptions(self, analyzer, optimal_lifestyle):
         """Test that explanation mentions sleep interruptions."""
@@ -437,7 +369,7 @@ class TestSleepAnalyzer:
             bedtime=time(22, 0),
             wake_time=time(5, 30),
             interruptions=3,
-            timestamp=datetime.now()
+            timestamp=_FROZEN_NOW
         )
         optimal_lifestyle.sleep_data = interrupted_sleep
         
@@ -446,64 +378,24 @@ class TestSleepAnalyzer:
         # Should mention interruptions
         assert "interruption" in analysis.explanation.lower()
     
-    def test_calculate_hours_between_same_day(self, analyzer):
-        """Test hour calculation for times on the same day."""
-        earlier = time(14, 0)  # 2 PM
-        later = time(22, 0)    # 10 PM
-        
-        hours = analyzer._calculate_hours_between(earlier, later)
-        
-        assert hours == 8.0
-    
-    def test_calculate_hours_between_crossing_midnight(self, analyzer):
-        """Test hour calculation for times crossing midnight."""
-        earlier = time(20, 0)  # 8 PM
-        later = time(2, 0)     # 2 AM next day
-        
+    @pytest.mark.parametrize("earlier,later,expected", [
+        (time(14, 0), time(22, 0), 8.0),  # 2 PM to 10 PM
+        (time(20, 0), time(2, 0), 6.0),  # 8 PM to 2 AM next day
+        (time(23, 59), time(0, 1), 2 / 60),  # One-minute crossing of midnight
+        (time(0, 0), time(0, 0), 0.0),  # Equal times
+    ], ids=["same_day", "crossing_midnight", "minute_crossing", "equal_times"])
+    def test_calculate_hours_between(self, analyzer, earlier, later, expected):
+        """Test hour calculation, handling times that cross midnight."""
         hours = analyzer._calculate_hours_between(earlier, later)
         
-        assert hours == 6.0
+        assert hours == pytest.approx(expected)
     
-    def test_no_disruptors_with_optimal_conditions(self, analyzer, optimal_lifestyle):
+    def test_no_disruptors_with_optimal_conditions(self, analyzer, borderline_sleep, optimal_lifestyle):
         """Test that no disruptors are identified with optimal conditions."""
-        optimal_lifestyle.sleep_data = SleepData(
-            duration=8.0,
-            quality=9,
-            bedtime=time(22, 0),
-            wake_time=time(6, 0),
-            interruptions=0,
-            timestamp=datetime.now()
-        )
+        optimal_lifestyle.sleep_data = borderline_sleep
         optimal_lifestyle.water_intake = 2500
         
         disruptors = analyzer.identify_sleep_disruptors(optimal_lifestyle)
         
         # Should have no or minimal disruptors
         assert len(disruptors) == 0
-    
-    def test_early_caffeine_not_flagged(self, analyzer, optimal_lifestyle):
-        """Test that early caffeine consumption is not flagged as disruptor."""
-        optimal_lifestyle.sleep_data = SleepData(
-            duration=8.0,
-            quality=8,
-            bedtime=time(22, 0),
-            wake_time=time(6, 0),
-            interruptions=0,
-            timestamp=datetime.now()
-        )
-        
-        # Add early caffeine (more than 6 hours before bed)
-        early_caffeine = Habit(
-            type=HabitType.CAFFEINE,
-            intensity=7,
-            duration=0.25,
-            timing=time(10, 0),  # 12 hours before bed
-            notes="Morning coffee"
-        )
-        optimal_lifestyle.daily_habits.append(early_caffeine)
-        
-        disruptors = analyzer.identify_sleep_disruptors(optimal_lifestyle)
-        
-        # Should not have caffeine disruptor
-        caffeine_disruptors = [d for d in disruptors if d.type == SleepDisruptorType.CAFFEINE]
-        assert len(caffeine_disruptors) == 0
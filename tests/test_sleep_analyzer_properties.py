@@ -1,5 +1,7 @@
 """Property-based tests for SleepAnalyzer using Hypothesis."""
 
+import re
+
 import pytest
 from hypothesis import given, strategies as st, settings, HealthCheck, assume
 from datetime import datetime, time, timedelta
@@ -23,87 +25,87 @@ from jeevanfit.analyzers import (
 )
 
 
+# Fixed timestamp for generated and hand-built inputs; only the time of day of
+# a lifestyle timestamp affects the analysis, and that is drawn explicitly
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0)
+
+# Minutes for generated times; the analyzer's timing cutoffs and severity steps
+# fall on whole or half hours, so quarter hours still reach every boundary
+_QUARTER_HOURS = st.sampled_from((0, 15, 30, 45))
+
+
 # Strategy for generating valid nutritional info
-@st.composite
-def nutritional_info_strategy(draw):
+def nutritional_info_strategy():
     """Generate valid NutritionalInfo instances."""
-    return NutritionalInfo(
-        calories=draw(st.floats(min_value=0, max_value=1000)),
-        protein=draw(st.floats(min_value=0, max_value=100)),
-        carbohydrates=draw(st.floats(min_value=0, max_value=200)),
-        fat=draw(st.floats(min_value=0, max_value=100)),
-        sodium=draw(st.floats(min_value=0, max_value=5000)),
-        sugar=draw(st.floats(min_value=0, max_value=100)),
-        fiber=draw(st.floats(min_value=0, max_value=50)),
-        preservatives=draw(st.lists(
-            st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=3, max_size=15),
+    return st.builds(
+        NutritionalInfo,
+        calories=st.floats(min_value=0, max_value=1000),
+        protein=st.floats(min_value=0, max_value=100),
+        carbohydrates=st.floats(min_value=0, max_value=200),
+        fat=st.floats(min_value=0, max_value=100),
+        sodium=st.floats(min_value=0, max_value=5000),
+        sugar=st.floats(min_value=0, max_value=100),
+        fiber=st.floats(min_value=0, max_value=50),
+        preservatives=st.lists(
+            st.from_regex(r'[a-z]{3,15}', fullmatch=True),
             min_size=0,
             max_size=5
-        )),
-        processing_level=draw(st.integers(min_value=1, max_value=5))
+        ),
+        processing_level=st.integers(min_value=1, max_value=5)
     )
 
 
 # Strategy for generating valid food items
-@st.composite
-def food_item_strategy(draw):
+def food_item_strategy():
     """Generate valid FoodItem instances."""
-    return FoodItem(
-        name=draw(st.text(alphabet='abcdefghijklmnopqrstuvwxyz ', min_size=1, max_size=30)),
-        serving_size=draw(st.floats(min_value=0.1, max_value=1000)),
-        unit=draw(st.sampled_from(['g', 'ml', 'oz', 'cup', 'tbsp', 'piece'])),
-        nutritional_info=draw(nutritional_info_strategy())
+    return st.builds(
+        FoodItem,
+        name=st.from_regex(r'[a-z ]{1,30}', fullmatch=True),
+        serving_size=st.floats(min_value=0.1, max_value=1000),
+        unit=st.sampled_from(['g', 'ml', 'oz', 'cup', 'tbsp', 'piece']),
+        nutritional_info=_NUTRITIONAL_INFO
     )
 
 
 # Strategy for generating valid sleep data
-@st.composite
-def sleep_data_strategy(draw, quality_range=None):
+def sleep_data_strategy(quality_range=None):
     """Generate valid SleepData instances with optional quality range."""
-    bedtime_hour = draw(st.integers(min_value=20, max_value=23))
-    wake_hour = draw(st.integers(min_value=5, max_value=10))
+    quality_min, quality_max = quality_range or (1, 10)
     
-    if quality_range:
-        quality = draw(st.integers(min_value=quality_range[0], max_value=quality_range[1]))
-    else:
-        quality = draw(st.integers(min_value=1, max_value=10))
-    
-    return SleepData(
-        duration=draw(st.floats(min_value=3.0, max_value=12.0)),
-        quality=quality,
-        bedtime=time(bedtime_hour, draw(st.integers(min_value=0, max_value=59))),
-        wake_time=time(wake_hour, draw(st.integers(min_value=0, max_value=59))),
-        interruptions=draw(st.integers(min_value=0, max_value=10)),
-        timestamp=datetime.now()
+    return st.builds(
+        SleepData,
+        duration=st.floats(min_value=3.0, max_value=12.0),
+        quality=st.integers(min_value=quality_min, max_value=quality_max),
+        bedtime=st.builds(time, st.integers(min_value=20, max_value=23), _QUARTER_HOURS),
+        wake_time=st.builds(time, st.integers(min_value=5, max_value=10), _QUARTER_HOURS),
+        interruptions=st.integers(min_value=0, max_value=10),
+        timestamp=st.just(_FIXED_NOW)
     )
 
 
 # Strategy for generating habits
-@st.composite
-def habit_strategy(draw, habit_type=None, timing_range=None):
+def habit_strategy(habit_type=None, timing_range=None):
     """Generate valid Habit instances with optional type and timing constraints."""
     if habit_type:
-        h_type = habit_type
+        h_type = st.just(habit_type)
     else:
-        h_type = draw(st.sampled_from([
+        h_type = st.sampled_from([
             HabitType.STRESS,
             HabitType.SCREEN_TIME,
             HabitType.CAFFEINE,
             HabitType.ALCOHOL,
             HabitType.OTHER
-        ]))
+        ])
     
-    if timing_range:
-        hour = draw(st.integers(min_value=timing_range[0], max_value=timing_range[1]))
-    else:
-        hour = draw(st.integers(min_value=6, max_value=22))
+    hour_min, hour_max = timing_range or (6, 22)
     
-    return Habit(
+    return st.builds(
+        Habit,
         type=h_type,
-        intensity=draw(st.integers(min_value=1, max_value=10)),
-        duration=draw(st.floats(min_value=0.1, max_value=8.0)),
-        timing=time(hour, draw(st.integers(min_value=0, max_value=59))),
-        notes=draw(st.text(alphabet='abcdefghijklmnopqrstuvwxyz ', max_size=50))
+        intensity=st.integers(min_value=1, max_value=10),
+        duration=st.floats(min_value=0.1, max_value=8.0),
+        timing=st.builds(time, st.integers(min_value=hour_min, max_value=hour_max), _QUARTER_HOURS),
+        notes=st.text(alphabet='abcdefghijklmnopqrstuvwxyz ', max_size=50)
     )
 
 
@@ -112,43 +114,148 @@ def habit_strategy(draw, habit_type=None, timing_range=None):
 def lifestyle_input_strategy(draw, sleep_data=None, habits=None):
     """Generate valid LifestyleInput instances with optional sleep and habits."""
     # Generate food items
-    food_items = draw(st.lists(food_item_strategy(), min_size=0, max_size=3))
+    food_items = draw(st.lists(_FOOD_ITEM, min_size=0, max_size=3))
     
     # Generate water intake
     water_intake = draw(st.floats(min_value=500, max_value=5000))
     
     # Use provided sleep data or generate
     if sleep_data is None:
-        sleep_data = draw(sleep_data_strategy())
+        sleep_data = draw(_SLEEP_DATA)
     
     # Use provided habits or generate
     if habits is None:
-        habits = draw(st.lists(habit_strategy(), min_size=0, max_size=3))
+        habits = draw(st.lists(_HABIT, min_size=0, max_size=3))
     
     return LifestyleInput(
         food_items=food_items,
         water_intake=water_intake,
         sleep_data=sleep_data,
         daily_habits=habits,
-        timestamp=datetime.now(),
+        timestamp=_FIXED_NOW.replace(hour=draw(st.integers(min_value=0, max_value=23))),
         user_id=draw(st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=20)),
         notes=draw(st.text(alphabet='abcdefghijklmnopqrstuvwxyz ', max_size=100))
     )
 
 
+# Default-argument strategy instances, built once at import and shared by the
+# strategy functions above and the tests below
+_NUTRITIONAL_INFO = nutritional_info_strategy()
+_FOOD_ITEM = food_item_strategy()
+_SLEEP_DATA = sleep_data_strategy()
+_HABIT = habit_strategy()
+_LIFESTYLE = lifestyle_input_strategy()
+
+# Complete SleepData fields; test_insufficient_data_handling drops one at a time
+_COMPLETE_SLEEP_DATA = {
+    'duration': 7.5,
+    'quality': 7,
+    'bedtime': time(22, 0),
+    'wake_time': time(5, 30),
+    'interruptions': 1,
+    'timestamp': _FIXED_NOW
+}
+
+# Case-insensitive keyword patterns, compiled once: words that mark a
+# correlation as being about each habit, and cause-effect language expected
+# in analysis explanations
+_HABIT_KEYWORD_RE = {
+    HabitType.CAFFEINE: re.compile(r'caffeine|coffee', re.IGNORECASE),
+    HabitType.STRESS: re.compile(r'stress', re.IGNORECASE),
+    HabitType.SCREEN_TIME: re.compile(r'screen|blue light', re.IGNORECASE),
+}
+_CAUSE_EFFECT_RE = re.compile(
+    r'affect|impact|influence|cause|result|lead|'
+    r'disrupt|interfere|improve|reduce|increase|'
+    r'factor|primary|contributing|because|due to',
+    re.IGNORECASE
+)
+
+# Day templates for test_sleep_correlation_detection, built once; each day
+# shares the habit and takes a copy of the sleep data with its own timestamp
+_DISRUPTIVE_HABITS = {
+    # Late caffeine (within 6 hours of bedtime at 22:00)
+    HabitType.CAFFEINE: Habit(
+        type=HabitType.CAFFEINE,
+        intensity=8,
+        duration=0.5,
+        timing=time(19, 0),  # 3 hours before bed
+        notes="Late caffeine"
+    ),
+    # High stress
+    HabitType.STRESS: Habit(
+        type=HabitType.STRESS,
+        intensity=9,
+        duration=6.0,
+        timing=time(14, 0),
+        notes="High stress"
+    ),
+    # Late screen time
+    HabitType.SCREEN_TIME: Habit(
+        type=HabitType.SCREEN_TIME,
+        intensity=7,
+        duration=2.0,
+        timing=time(21, 0),  # 1 hour before bed
+        notes="Late screen time"
+    ),
+}
+_POOR_SLEEP = SleepData(
+    duration=5.5,
+    quality=4,
+    bedtime=time(22, 0),
+    wake_time=time(3, 30),
+    interruptions=3,
+    timestamp=_FIXED_NOW
+)
+_GOOD_SLEEP = SleepData(
+    duration=8.0,
+    quality=9,
+    bedtime=time(22, 0),
+    wake_time=time(6, 0),
+    interruptions=0,
+    timestamp=_FIXED_NOW
+)
+
+
+
+def _make_lifestyle(habits=(), water=2000, sleep=None, timestamp=_FIXED_NOW, food=()):
+    """Build a LifestyleInput for the fixed test user from the given factors."""
+    return LifestyleInput(
+        food_items=list(food),
+        water_intake=water,
+        sleep_data=sleep,
+        daily_habits=list(habits),
+        timestamp=timestamp,
+        user_id="test-user",
+        notes=""
+    )
+
+
+def _analysis_signature(analysis):
+    """Counts and distinct habits/actions of an analysis's correlations and recommendations."""
+    return (
+        len(analysis.correlations),
+        frozenset(c.habit for c in analysis.correlations),
+        len(analysis.recommendations),
+        frozenset(r.action for r in analysis.recommendations),
+    )
+
+
 class TestSleepAnalyzerProperties:
     """Property-based tests for SleepAnalyzer."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.analyzer = SleepAnalyzer()
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _shared_analyzer(cls):
+        """Create one SleepAnalyzer for every test in the class; it holds no state."""
+        cls.analyzer = SleepAnalyzer()
     
     # Feature: fitbuddy-lifestyle-assistant, Property 9: Sleep correlation detection
     @given(
         habit_type=st.sampled_from([HabitType.CAFFEINE, HabitType.STRESS, HabitType.SCREEN_TIME]),
         num_days=st.integers(min_value=3, max_value=7)
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+    @settings(max_examples=25, deadline=None)
     def test_sleep_correlation_detection(self, habit_type, num_days):
         """
         Property 9: Sleep correlation detection
@@ -162,7 +269,7 @@ class TestSleepAnalyzerProperties:
         # Pattern: Days WITH the disruptive habit have poor sleep
         #          Days WITHOUT the habit have good sleep
         
-        base_date = datetime(2024, 1, 1, 12, 0)
+        base_date = _FIXED_NOW
         
         # Create alternating pattern: habit present -> poor sleep, habit absent -> good sleep
         datasets = []
@@ -174,94 +281,34 @@ class TestSleepAnalyzerProperties:
             has_disruptive_habit = (day % 2 == 0)
             
             if has_disruptive_habit:
-                # Create disruptive habit based on type
-                if habit_type == HabitType.CAFFEINE:
-                    # Late caffeine (within 6 hours of bedtime at 22:00)
-                    habit = Habit(
-                        type=HabitType.CAFFEINE,
-                        intensity=8,
-                        duration=0.5,
-                        timing=time(19, 0),  # 3 hours before bed
-                        notes="Late caffeine"
-                    )
-                elif habit_type == HabitType.STRESS:
-                    # High stress
-                    habit = Habit(
-                        type=HabitType.STRESS,
-                        intensity=9,
-                        duration=6.0,
-                        timing=time(14, 0),
-                        notes="High stress"
-                    )
-                else:  # SCREEN_TIME
-                    # Late screen time
-                    habit = Habit(
-                        type=HabitType.SCREEN_TIME,
-                        intensity=7,
-                        duration=2.0,
-                        timing=time(21, 0),  # 1 hour before bed
-                        notes="Late screen time"
-                    )
-                
-                habits = [habit]
-                
-                # Poor sleep quality
-                sleep_data = SleepData(
-                    duration=5.5,
-                    quality=4,
-                    bedtime=time(22, 0),
-                    wake_time=time(3, 30),
-                    interruptions=3,
-                    timestamp=current_date
-                )
+                # Disruptive habit with poor sleep quality
+                habits = [_DISRUPTIVE_HABITS[habit_type]]
+                sleep_template = _POOR_SLEEP
             else:
-                # No disruptive habit
+                # No disruptive habit, good sleep quality
                 habits = []
-                
-                # Good sleep quality
-                sleep_data = SleepData(
-                    duration=8.0,
-                    quality=9,
-                    bedtime=time(22, 0),
-                    wake_time=time(6, 0),
-                    interruptions=0,
-                    timestamp=current_date
-                )
+                sleep_template = _GOOD_SLEEP
+            
+            sleep_data = sleep_template.model_copy(update=dict(timestamp=current_date))
             
             # Create lifestyle input for this day
-            lifestyle = LifestyleInput(
-                food_items=[],
-                water_intake=2000,
-                sleep_data=sleep_data,
-                daily_habits=habits,
-                timestamp=current_date,
-                user_id="test-user",
-                notes=""
-            )
+            lifestyle = _make_lifestyle(habits, sleep=sleep_data, timestamp=current_date)
             
             datasets.append((lifestyle, sleep_data))
         
-        # Analyze each day and collect correlations
-        all_correlations = []
-        for lifestyle, sleep_data in datasets:
-            analysis = self.analyzer.analyze_sleep(sleep_data, lifestyle)
-            all_correlations.extend(analysis.correlations)
+        # Analyze each day once, keeping the analysis for the per-day checks below
+        analyses = [
+            (lifestyle, self.analyzer.analyze_sleep(sleep_data, lifestyle))
+            for lifestyle, sleep_data in datasets
+        ]
+        all_correlations = [c for _, analysis in analyses for c in analysis.correlations]
         
         # Verify that the analyzer identified correlations related to the habit
         # At least one correlation should mention the habit type
-        habit_keywords = {
-            HabitType.CAFFEINE: ['caffeine', 'coffee'],
-            HabitType.STRESS: ['stress'],
-            HabitType.SCREEN_TIME: ['screen', 'blue light']
-        }
-        
-        keywords = habit_keywords[habit_type]
+        keyword_re = _HABIT_KEYWORD_RE[habit_type]
         
         # Find correlations that mention the habit
-        relevant_correlations = [
-            c for c in all_correlations
-            if any(keyword in c.habit.lower() for keyword in keywords)
-        ]
+        relevant_correlations = [c for c in all_correlations if keyword_re.search(c.habit)]
         
         # Verify correlations were detected
         assert len(relevant_correlations) > 0, \
@@ -295,20 +342,15 @@ class TestSleepAnalyzerProperties:
         
         # Additional verification: Days with the habit should have been analyzed
         # and should show the correlation in their individual analyses
-        days_with_habit = [d for d in datasets if len(d[0].daily_habits) > 0]
+        days_with_habit = [a for lifestyle, a in analyses if len(lifestyle.daily_habits) > 0]
         
-        for lifestyle, sleep_data in days_with_habit:
-            analysis = self.analyzer.analyze_sleep(sleep_data, lifestyle)
-            
+        for analysis in days_with_habit:
             # This day should have correlations
             assert len(analysis.correlations) > 0, \
                 "Days with disruptive habits should have identified correlations"
             
             # At least one correlation should be about the habit
-            day_relevant_correlations = [
-                c for c in analysis.correlations
-                if any(keyword in c.habit.lower() for keyword in keywords)
-            ]
+            day_relevant_correlations = [c for c in analysis.correlations if keyword_re.search(c.habit)]
             
             assert len(day_relevant_correlations) > 0, \
                 f"Analysis for day with {habit_type.value} should identify correlation with that habit"
@@ -320,7 +362,7 @@ class TestSleepAnalyzerProperties:
         water_intake=st.floats(min_value=500, max_value=4000),
         stress_level=st.integers(min_value=1, max_value=10)
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+    @settings(max_examples=25, deadline=None)
     def test_multi_factor_sleep_consideration(self, food_timing_hours, caffeine_hours, water_intake, stress_level):
         """
         Property 10: Multi-factor sleep consideration
@@ -337,7 +379,7 @@ class TestSleepAnalyzerProperties:
             bedtime=time(22, 0),
             wake_time=time(5, 0),
             interruptions=1,
-            timestamp=datetime.now()
+            timestamp=_FIXED_NOW
         )
         
         # Calculate timing for food and caffeine based on bedtime (22:00)
@@ -346,8 +388,8 @@ class TestSleepAnalyzerProperties:
         caffeine_hour = int(bedtime_hour - caffeine_hours) % 24
         
         # Create lifestyle with all factors
-        lifestyle_all_factors = LifestyleInput(
-            food_items=[FoodItem(
+        lifestyle_all_factors = _make_lifestyle(
+            food=[FoodItem(
                 name="Dinner",
                 serving_size=300,
                 unit="g",
@@ -357,9 +399,9 @@ class TestSleepAnalyzerProperties:
                     processing_level=2
                 )
             )],
-            water_intake=water_intake,
-            sleep_data=base_sleep,
-            daily_habits=[
+            water=water_intake,
+            sleep=base_sleep,
+            habits=[
                 Habit(
                     type=HabitType.CAFFEINE,
                     intensity=7,
@@ -375,62 +417,37 @@ class TestSleepAnalyzerProperties:
                     notes="Stress"
                 )
             ],
-            timestamp=datetime(2024, 1, 15, food_hour, 0),
-            user_id="test-user",
-            notes=""
+            timestamp=datetime(2024, 1, 15, food_hour, 0)
         )
         
         # Analyze with all factors
         analysis_all = self.analyzer.analyze_sleep(base_sleep, lifestyle_all_factors)
         
-        # Now test each factor independently by removing it
+        # Now test each factor independently by removing or changing it on a
+        # copy of the all-factors lifestyle
         # Test 1: Remove caffeine
-        lifestyle_no_caffeine = LifestyleInput(
-            food_items=lifestyle_all_factors.food_items,
-            water_intake=water_intake,
-            sleep_data=base_sleep,
-            daily_habits=[h for h in lifestyle_all_factors.daily_habits if h.type != HabitType.CAFFEINE],
-            timestamp=lifestyle_all_factors.timestamp,
-            user_id="test-user",
-            notes=""
-        )
+        lifestyle_no_caffeine = lifestyle_all_factors.model_copy(update=dict(
+            daily_habits=[h for h in lifestyle_all_factors.daily_habits if h.type != HabitType.CAFFEINE]
+        ))
         analysis_no_caffeine = self.analyzer.analyze_sleep(base_sleep, lifestyle_no_caffeine)
         
         # Test 2: Remove stress
-        lifestyle_no_stress = LifestyleInput(
-            food_items=lifestyle_all_factors.food_items,
-            water_intake=water_intake,
-            sleep_data=base_sleep,
-            daily_habits=[h for h in lifestyle_all_factors.daily_habits if h.type != HabitType.STRESS],
-            timestamp=lifestyle_all_factors.timestamp,
-            user_id="test-user",
-            notes=""
-        )
+        lifestyle_no_stress = lifestyle_all_factors.model_copy(update=dict(
+            daily_habits=[h for h in lifestyle_all_factors.daily_habits if h.type != HabitType.STRESS]
+        ))
         analysis_no_stress = self.analyzer.analyze_sleep(base_sleep, lifestyle_no_stress)
         
         # Test 3: Change hydration significantly
-        lifestyle_diff_hydration = LifestyleInput(
-            food_items=lifestyle_all_factors.food_items,
-            water_intake=water_intake + 1500 if water_intake < 2500 else water_intake - 1500,
-            sleep_data=base_sleep,
-            daily_habits=lifestyle_all_factors.daily_habits,
-            timestamp=lifestyle_all_factors.timestamp,
-            user_id="test-user",
-            notes=""
-        )
+        lifestyle_diff_hydration = lifestyle_all_factors.model_copy(update=dict(
+            water_intake=water_intake + 1500 if water_intake < 2500 else water_intake - 1500
+        ))
         analysis_diff_hydration = self.analyzer.analyze_sleep(base_sleep, lifestyle_diff_hydration)
         
         # Test 4: Change food timing significantly
         new_food_hour = (food_hour + 4) % 24  # 4 hours difference
-        lifestyle_diff_food_timing = LifestyleInput(
-            food_items=lifestyle_all_factors.food_items,
-            water_intake=water_intake,
-            sleep_data=base_sleep,
-            daily_habits=lifestyle_all_factors.daily_habits,
-            timestamp=datetime(2024, 1, 15, new_food_hour, 0),
-            user_id="test-user",
-            notes=""
-        )
+        lifestyle_diff_food_timing = lifestyle_all_factors.model_copy(update=dict(
+            timestamp=datetime(2024, 1, 15, new_food_hour, 0)
+        ))
         analysis_diff_food_timing = self.analyzer.analyze_sleep(base_sleep, lifestyle_diff_food_timing)
         
         # Collect all analyses
@@ -445,34 +462,11 @@ class TestSleepAnalyzerProperties:
         # Verify that changing factors affects the analysis
         # At least one of the modified analyses should differ from the original
         
-        # Compare correlations
-        correlations_differ = False
-        for analysis in [analysis_no_caffeine, analysis_no_stress, analysis_diff_hydration, analysis_diff_food_timing]:
-            # Check if number of correlations differs
-            if len(analysis.correlations) != len(analysis_all.correlations):
-                correlations_differ = True
-                break
-            
-            # Check if correlation types differ
-            all_habits = {c.habit for c in analysis_all.correlations}
-            test_habits = {c.habit for c in analysis.correlations}
-            if all_habits != test_habits:
-                correlations_differ = True
-                break
-        
-        # Compare recommendations
-        recommendations_differ = False
-        for analysis in [analysis_no_caffeine, analysis_no_stress, analysis_diff_hydration, analysis_diff_food_timing]:
-            if len(analysis.recommendations) != len(analysis_all.recommendations):
-                recommendations_differ = True
-                break
-            
-            # Check if recommendation actions differ
-            all_actions = {r.action for r in analysis_all.recommendations}
-            test_actions = {r.action for r in analysis.recommendations}
-            if all_actions != test_actions:
-                recommendations_differ = True
-                break
+        # Compare each modified analysis with the original on correlation and
+        # recommendation signatures, each extracted once per analysis
+        base_sig, *modified_sigs = [_analysis_signature(a) for a in all_analyses]
+        correlations_differ = any(sig[:2] != base_sig[:2] for sig in modified_sigs)
+        recommendations_differ = any(sig[2:] != base_sig[2:] for sig in modified_sigs)
         
         # At least one aspect should differ when we change factors
         assert correlations_differ or recommendations_differ, \
@@ -497,7 +491,7 @@ class TestSleepAnalyzerProperties:
         sleep_duration=st.floats(min_value=3.0, max_value=12.0),
         water_intake=st.floats(min_value=500, max_value=4000)
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+    @settings(max_examples=25, deadline=None)
     def test_sleep_recommendations_presence(self, sleep_quality, sleep_duration, water_intake):
         """
         Property 11: Sleep recommendations presence
@@ -513,12 +507,12 @@ class TestSleepAnalyzerProperties:
             bedtime=time(22, 0),
             wake_time=time(6, 0),
             interruptions=2 if sleep_quality < 7 else 0,
-            timestamp=datetime.now()
+            timestamp=_FIXED_NOW
         )
         
         # Create lifestyle with some potential disruptors
-        lifestyle = LifestyleInput(
-            food_items=[FoodItem(
+        lifestyle = _make_lifestyle(
+            food=[FoodItem(
                 name="Meal",
                 serving_size=200,
                 unit="g",
@@ -528,9 +522,9 @@ class TestSleepAnalyzerProperties:
                     processing_level=2
                 )
             )],
-            water_intake=water_intake,
-            sleep_data=sleep_data,
-            daily_habits=[
+            water=water_intake,
+            sleep=sleep_data,
+            habits=[
                 Habit(
                     type=HabitType.CAFFEINE,
                     intensity=6,
@@ -546,9 +540,7 @@ class TestSleepAnalyzerProperties:
                     notes="Work stress"
                 )
             ],
-            timestamp=datetime(2024, 1, 15, 20, 0),
-            user_id="test-user",
-            notes=""
+            timestamp=datetime(2024, 1, 15, 20, 0)
         )
         
         # Analyze sleep
@@ -588,9 +580,13 @@ class TestSleepAnalyzerProperties:
 
     # Feature: fitbuddy-lifestyle-assistant, Property 12: Cause-effect explanation structure
     @given(
-        lifestyle=lifestyle_input_strategy()
+        lifestyle=_LIFESTYLE
+    )
+    @settings(
+        max_examples=25,
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow]
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
     def test_cause_effect_explanation_structure(self, lifestyle):
         """
         Property 12: Cause-effect explanation structure
@@ -599,16 +595,10 @@ class TestSleepAnalyzerProperties:
         
         Validates: Requirements 3.4
         """
-        # Ensure lifestyle has sleep data
-        if lifestyle.sleep_data is None:
-            lifestyle.sleep_data = SleepData(
-                duration=7.0,
-                quality=6,
-                bedtime=time(22, 0),
-                wake_time=time(5, 0),
-                interruptions=1,
-                timestamp=datetime.now()
-            )
+        # Only lifestyles with sleep data and at least one food item or habit
+        # can exercise the cause-effect path
+        assume(lifestyle.sleep_data is not None)
+        assume(lifestyle.daily_habits or lifestyle.food_items)
         
         # Analyze sleep
         analysis = self.analyzer.analyze_sleep(lifestyle.sleep_data, lifestyle)
@@ -623,46 +613,28 @@ class TestSleepAnalyzerProperties:
         
         # Verify explanation contains cause-effect structure
         # Look for indicators of cause-effect relationships
-        cause_effect_indicators = [
-            'affect', 'impact', 'influence', 'cause', 'result', 'lead',
-            'disrupt', 'interfere', 'improve', 'reduce', 'increase',
-            'factor', 'primary', 'contributing', 'because', 'due to'
-        ]
-        
-        explanation_lower = analysis.explanation.lower()
-        has_cause_effect = any(indicator in explanation_lower for indicator in cause_effect_indicators)
+        has_cause_effect = _CAUSE_EFFECT_RE.search(analysis.explanation) is not None
         
         assert has_cause_effect, \
             f"Sleep analysis explanation should contain cause-effect language linking habits to outcomes. " \
             f"Expected words like 'affect', 'impact', 'cause', etc. " \
             f"Got: '{analysis.explanation}'"
         
-        # If there are negative correlations, the explanation should reference them
+        # If there are negative correlations, the explanation should reference
+        # at least one of them by sharing a key term (longer than 3 chars) with
+        # its habit
         negative_correlations = [c for c in analysis.correlations if c.impact == ImpactType.NEGATIVE]
         
-        if len(negative_correlations) > 0:
-            # The explanation should mention at least one negative correlation
-            # by referencing habits or factors
-            correlation_mentioned = False
-            
-            for correlation in negative_correlations:
-                # Extract key terms from correlation habit
-                habit_terms = correlation.habit.lower().split()
-                
-                # Check if any term appears in explanation
-                for term in habit_terms:
-                    if len(term) > 3 and term in explanation_lower:
-                        correlation_mentioned = True
-                        break
-                
-                if correlation_mentioned:
-                    break
-            
-            # Only assert if we have negative correlations - neutral ones may not be mentioned
-            if not correlation_mentioned:
-                # This is acceptable if the explanation mentions "no significant factors"
-                # which is valid when only neutral correlations exist
-                pass
+        if negative_correlations:
+            explanation_tokens = frozenset(
+                w for w in analysis.explanation.lower().split() if len(w) > 3
+            )
+            assert any(
+                explanation_tokens & frozenset(w for w in c.habit.lower().split() if len(w) > 3)
+                for c in negative_correlations
+            ), \
+                f"Explanation should mention at least one negative correlation " \
+                f"({[c.habit for c in negative_correlations]}), got: '{analysis.explanation}'"
         
         # Verify correlations themselves contain cause-effect descriptions
         for correlation in analysis.correlations:
@@ -675,10 +647,8 @@ class TestSleepAnalyzerProperties:
 
 
     # Feature: fitbuddy-lifestyle-assistant, Property 13: Insufficient data handling
-    @given(
-        missing_field=st.sampled_from(['duration', 'quality', 'bedtime', 'wake_time'])
-    )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+    # The four required fields are few enough to check exhaustively
+    @pytest.mark.parametrize('missing_field', ['duration', 'quality', 'bedtime', 'wake_time'])
     def test_insufficient_data_handling(self, missing_field):
         """
         Property 13: Insufficient data handling
@@ -688,30 +658,11 @@ class TestSleepAnalyzerProperties:
         
         Validates: Requirements 3.5
         """
-        # Create a complete sleep data first
-        complete_sleep_data = {
-            'duration': 7.5,
-            'quality': 7,
-            'bedtime': time(22, 0),
-            'wake_time': time(5, 30),
-            'interruptions': 1,
-            'timestamp': datetime.now()
-        }
-        
-        # Remove the specified field to create incomplete data
-        incomplete_data = complete_sleep_data.copy()
-        del incomplete_data[missing_field]
+        # Drop the specified field from complete sleep data to create incomplete data
+        incomplete_data = {k: v for k, v in _COMPLETE_SLEEP_DATA.items() if k != missing_field}
         
         # Create lifestyle input
-        lifestyle = LifestyleInput(
-            food_items=[],
-            water_intake=2000,
-            sleep_data=None,  # Will try to create with incomplete data
-            daily_habits=[],
-            timestamp=datetime.now(),
-            user_id="test-user",
-            notes=""
-        )
+        lifestyle = _make_lifestyle()  # No sleep data; built from incomplete fields below
         
         # Try to create SleepData with incomplete data and verify it raises validation error
         with pytest.raises((ValueError, TypeError, Exception)) as exc_info: